@@ -8,6 +8,10 @@ d = { 'settings': { 'branch': 'main',
   'syms': { 'archetypon.base_model': { 'archetypon.base_model.Base': ('base_model.html#base', 'archetypon/base_model.py'),
                                        'archetypon.base_model.Base.Config': ('base_model.html#base.config', 'archetypon/base_model.py'),
                                        'archetypon.base_model.Base.Display': ('base_model.html#base.display', 'archetypon/base_model.py'),
+                                       'archetypon.base_model.Base._display_json_str': ( 'base_model.html#base._display_json_str',
+                                                                                         'archetypon/base_model.py'),
+                                       'archetypon.base_model.Base._display_option': ( 'base_model.html#base._display_option',
+                                                                                       'archetypon/base_model.py'),
                                        'archetypon.base_model.Base._repr_html_': ( 'base_model.html#base._repr_html_',
                                                                                    'archetypon/base_model.py'),
                                        'archetypon.base_model.Base._repr_json_': ( 'base_model.html#base._repr_json_',
@@ -18,6 +22,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'archetypon/base_model.py'),
                                        'archetypon.base_model.Base.display_schema_json': ( 'base_model.html#base.display_schema_json',
                                                                                            'archetypon/base_model.py'),
+                                       'archetypon.base_model.Base.json_stream': ( 'base_model.html#base.json_stream',
+                                                                                   'archetypon/base_model.py'),
                                        'archetypon.base_model.Base.schema_html': ( 'base_model.html#base.schema_html',
                                                                                    'archetypon/base_model.py'),
                                        'archetypon.base_model.Base.schema_yml': ( 'base_model.html#base.schema_yml',
@@ -34,23 +40,73 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'archetypon/base_model.py'),
                                        'archetypon.base_model.DataFrameModel': ( 'base_model.html#dataframemodel',
                                                                                  'archetypon/base_model.py'),
+                                       'archetypon.base_model.DataFrameModel._data_html': ( 'base_model.html#dataframemodel._data_html',
+                                                                                            'archetypon/base_model.py'),
                                        'archetypon.base_model.DataFrameModel._repr_html_': ( 'base_model.html#dataframemodel._repr_html_',
                                                                                              'archetypon/base_model.py'),
                                        'archetypon.base_model.DataFrameModel._repr_json_': ( 'base_model.html#dataframemodel._repr_json_',
                                                                                              'archetypon/base_model.py'),
+                                       'archetypon.base_model.DataFrameModel._schema_html': ( 'base_model.html#dataframemodel._schema_html',
+                                                                                              'archetypon/base_model.py'),
                                        'archetypon.base_model.DataFrameModel.create_dataframe': ( 'base_model.html#dataframemodel.create_dataframe',
                                                                                                   'archetypon/base_model.py'),
                                        'archetypon.base_model.GenericModel': ('base_model.html#genericmodel', 'archetypon/base_model.py'),
                                        'archetypon.base_model.GenericModel.Config': ( 'base_model.html#genericmodel.config',
                                                                                       'archetypon/base_model.py'),
+                                       'archetypon.base_model._as_dataframe': ('base_model.html#_as_dataframe', 'archetypon/base_model.py'),
+                                       'archetypon.base_model._dataframe_to_json': ( 'base_model.html#_dataframe_to_json',
+                                                                                     'archetypon/base_model.py'),
+                                       'archetypon.base_model._is_stock_encoder': ( 'base_model.html#_is_stock_encoder',
+                                                                                    'archetypon/base_model.py'),
+                                       'archetypon.base_model._json_dumps': ('base_model.html#_json_dumps', 'archetypon/base_model.py'),
+                                       'archetypon.base_model._module_models': ( 'base_model.html#_module_models',
+                                                                                 'archetypon/base_model.py'),
+                                       'archetypon.base_model._schema_type': ('base_model.html#_schema_type', 'archetypon/base_model.py'),
+                                       'archetypon.base_model._truncate_frame': ( 'base_model.html#_truncate_frame',
+                                                                                  'archetypon/base_model.py'),
+                                       'archetypon.base_model._write_frame': ('base_model.html#_write_frame', 'archetypon/base_model.py'),
                                        'archetypon.base_model.dict_to_yaml': ('base_model.html#dict_to_yaml', 'archetypon/base_model.py'),
+                                       'archetypon.base_model.export_dbt_schema': ( 'base_model.html#export_dbt_schema',
+                                                                                    'archetypon/base_model.py'),
                                        'archetypon.base_model.pydantic_to_dbt': ( 'base_model.html#pydantic_to_dbt',
                                                                                   'archetypon/base_model.py')},
-            'archetypon.core': {},
+            'archetypon.core': {'archetypon.core.__getattr__': ('core.html#__getattr__', 'archetypon/core.py')},
             'archetypon.database': { 'archetypon.database.AbstractDatabaseClass': ( 'database.html#abstractdatabaseclass',
                                                                                     'archetypon/database.py'),
                                      'archetypon.database.AbstractDatabaseClass.__repr__': ( 'database.html#abstractdatabaseclass.__repr__',
                                                                                              'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._batch_writer': ( 'database.html#abstractdatabaseclass._batch_writer',
+                                                                                                  'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._cache_key': ( 'database.html#abstractdatabaseclass._cache_key',
+                                                                                               'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._copy_batch': ( 'database.html#abstractdatabaseclass._copy_batch',
+                                                                                                'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._insert_batch': ( 'database.html#abstractdatabaseclass._insert_batch',
+                                                                                                  'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._load_metadata': ( 'database.html#abstractdatabaseclass._load_metadata',
+                                                                                                   'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._metadata_file': ( 'database.html#abstractdatabaseclass._metadata_file',
+                                                                                                   'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._read_df': ( 'database.html#abstractdatabaseclass._read_df',
+                                                                                             'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass._save_metadata': ( 'database.html#abstractdatabaseclass._save_metadata',
+                                                                                                   'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.aquery_to_df': ( 'database.html#abstractdatabaseclass.aquery_to_df',
+                                                                                                 'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.aquery_to_records': ( 'database.html#abstractdatabaseclass.aquery_to_records',
+                                                                                                      'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.gather_queries': ( 'database.html#abstractdatabaseclass.gather_queries',
+                                                                                                   'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.invalidate_cache': ( 'database.html#abstractdatabaseclass.invalidate_cache',
+                                                                                                     'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.iter_arrow_batches': ( 'database.html#abstractdatabaseclass.iter_arrow_batches',
+                                                                                                       'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.iter_df': ( 'database.html#abstractdatabaseclass.iter_df',
+                                                                                            'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.iter_records': ( 'database.html#abstractdatabaseclass.iter_records',
+                                                                                                 'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.query_many': ( 'database.html#abstractdatabaseclass.query_many',
+                                                                                               'archetypon/database.py'),
                                      'archetypon.database.AbstractDatabaseClass.query_to_df': ( 'database.html#abstractdatabaseclass.query_to_df',
                                                                                                 'archetypon/database.py'),
                                      'archetypon.database.AbstractDatabaseClass.query_to_records': ( 'database.html#abstractdatabaseclass.query_to_records',
@@ -59,6 +115,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'archetypon/database.py'),
                                      'archetypon.database.AbstractDatabaseClass.tables': ( 'database.html#abstractdatabaseclass.tables',
                                                                                            'archetypon/database.py'),
+                                     'archetypon.database.AbstractDatabaseClass.write_df': ( 'database.html#abstractdatabaseclass.write_df',
+                                                                                             'archetypon/database.py'),
                                      'archetypon.database.Database': ('database.html#database', 'archetypon/database.py'),
                                      'archetypon.database.Database.Config': ('database.html#database.config', 'archetypon/database.py'),
                                      'archetypon.database.Database.__init__': ('database.html#database.__init__', 'archetypon/database.py'),
@@ -67,6 +125,27 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'archetypon/database.py'),
                                      'archetypon.database.DatabaseCredentialsBase': ( 'database.html#databasecredentialsbase',
                                                                                       'archetypon/database.py'),
+                                     'archetypon.database.DatabaseCredentialsBase._engine_options': ( 'database.html#databasecredentialsbase._engine_options',
+                                                                                                      'archetypon/database.py'),
+                                     'archetypon.database.QueryCache': ('database.html#querycache', 'archetypon/database.py'),
+                                     'archetypon.database.QueryCache.__init__': ( 'database.html#querycache.__init__',
+                                                                                  'archetypon/database.py'),
+                                     'archetypon.database.QueryCache._evict_files': ( 'database.html#querycache._evict_files',
+                                                                                      'archetypon/database.py'),
+                                     'archetypon.database.QueryCache._expired': ( 'database.html#querycache._expired',
+                                                                                  'archetypon/database.py'),
+                                     'archetypon.database.QueryCache._file': ('database.html#querycache._file', 'archetypon/database.py'),
+                                     'archetypon.database.QueryCache._forget': ( 'database.html#querycache._forget',
+                                                                                 'archetypon/database.py'),
+                                     'archetypon.database.QueryCache._lookup': ( 'database.html#querycache._lookup',
+                                                                                 'archetypon/database.py'),
+                                     'archetypon.database.QueryCache._remember': ( 'database.html#querycache._remember',
+                                                                                   'archetypon/database.py'),
+                                     'archetypon.database.QueryCache.get': ('database.html#querycache.get', 'archetypon/database.py'),
+                                     'archetypon.database.QueryCache.invalidate': ( 'database.html#querycache.invalidate',
+                                                                                    'archetypon/database.py'),
+                                     'archetypon.database.QueryCache.key': ('database.html#querycache.key', 'archetypon/database.py'),
+                                     'archetypon.database.QueryCache.put': ('database.html#querycache.put', 'archetypon/database.py'),
                                      'archetypon.database.SnowflakeCredentials': ( 'database.html#snowflakecredentials',
                                                                                    'archetypon/database.py'),
                                      'archetypon.database.SnowflakeDatabase': ('database.html#snowflakedatabase', 'archetypon/database.py'),
@@ -75,11 +154,56 @@ d = { 'settings': { 'branch': 'main',
                                      'archetypon.database.SnowflakeDatabase.__init__': ( 'database.html#snowflakedatabase.__init__',
                                                                                          'archetypon/database.py'),
                                      'archetypon.database.SnowflakeDatabase.__repr__': ( 'database.html#snowflakedatabase.__repr__',
-                                                                                         'archetypon/database.py')},
+                                                                                         'archetypon/database.py'),
+                                     'archetypon.database.SnowflakeDatabase._arrow_to_df': ( 'database.html#snowflakedatabase._arrow_to_df',
+                                                                                             'archetypon/database.py'),
+                                     'archetypon.database.SnowflakeDatabase._cursor': ( 'database.html#snowflakedatabase._cursor',
+                                                                                        'archetypon/database.py'),
+                                     'archetypon.database.SnowflakeDatabase._normalize_columns': ( 'database.html#snowflakedatabase._normalize_columns',
+                                                                                                   'archetypon/database.py'),
+                                     'archetypon.database.SnowflakeDatabase._read_df': ( 'database.html#snowflakedatabase._read_df',
+                                                                                         'archetypon/database.py'),
+                                     'archetypon.database.SnowflakeDatabase._stage_batch': ( 'database.html#snowflakedatabase._stage_batch',
+                                                                                             'archetypon/database.py'),
+                                     'archetypon.database.SnowflakeDatabase.iter_arrow_batches': ( 'database.html#snowflakedatabase.iter_arrow_batches',
+                                                                                                   'archetypon/database.py'),
+                                     'archetypon.database._LazyTables': ('database.html#_lazytables', 'archetypon/database.py'),
+                                     'archetypon.database._LazyTables.__getitem__': ( 'database.html#_lazytables.__getitem__',
+                                                                                      'archetypon/database.py'),
+                                     'archetypon.database._LazyTables.__init__': ( 'database.html#_lazytables.__init__',
+                                                                                   'archetypon/database.py'),
+                                     'archetypon.database._LazyTables.__iter__': ( 'database.html#_lazytables.__iter__',
+                                                                                   'archetypon/database.py'),
+                                     'archetypon.database._LazyTables.__len__': ( 'database.html#_lazytables.__len__',
+                                                                                  'archetypon/database.py'),
+                                     'archetypon.database._LazyTables.__repr__': ( 'database.html#_lazytables.__repr__',
+                                                                                   'archetypon/database.py'),
+                                     'archetypon.database._LazyTables._names': ( 'database.html#_lazytables._names',
+                                                                                 'archetypon/database.py'),
+                                     'archetypon.database._is_int_field': ('database.html#_is_int_field', 'archetypon/database.py'),
+                                     'archetypon.database._rows_as': ('database.html#_rows_as', 'archetypon/database.py'),
+                                     'archetypon.database._shared_engine': ('database.html#_shared_engine', 'archetypon/database.py')},
             'archetypon.delegates': {'archetypon.delegates.delegates': ('delegates.html#delegates', 'archetypon/delegates.py')},
             'archetypon.formatting': { 'archetypon.formatting.Formatter': ('formatting.html#formatter', 'archetypon/formatting.py'),
                                        'archetypon.formatting.Formatter.__init__': ( 'formatting.html#formatter.__init__',
                                                                                      'archetypon/formatting.py'),
+                                       'archetypon.formatting.Formatter.format_frame': ( 'formatting.html#formatter.format_frame',
+                                                                                         'archetypon/formatting.py'),
+                                       'archetypon.formatting.Formatter.to_html': ( 'formatting.html#formatter.to_html',
+                                                                                    'archetypon/formatting.py'),
+                                       'archetypon.formatting._as_multiples': ('formatting.html#_as_multiples', 'archetypon/formatting.py'),
+                                       'archetypon.formatting._big_dollars': ('formatting.html#_big_dollars', 'archetypon/formatting.py'),
+                                       'archetypon.formatting._big_numbers': ('formatting.html#_big_numbers', 'archetypon/formatting.py'),
+                                       'archetypon.formatting._cached_format_factory': ( 'formatting.html#_cached_format_factory',
+                                                                                         'archetypon/formatting.py'),
+                                       'archetypon.formatting._compile_format': ( 'formatting.html#_compile_format',
+                                                                                  'archetypon/formatting.py'),
+                                       'archetypon.formatting._format_array': ('formatting.html#_format_array', 'archetypon/formatting.py'),
+                                       'archetypon.formatting._format_factory': ( 'formatting.html#_format_factory',
+                                                                                  'archetypon/formatting.py'),
+                                       'archetypon.formatting._format_minutes': ( 'formatting.html#_format_minutes',
+                                                                                  'archetypon/formatting.py'),
+                                       'archetypon.formatting._is_null': ('formatting.html#_is_null', 'archetypon/formatting.py'),
                                        'archetypon.formatting.as_multiple': ('formatting.html#as_multiple', 'archetypon/formatting.py'),
                                        'archetypon.formatting.big_dollars': ('formatting.html#big_dollars', 'archetypon/formatting.py'),
                                        'archetypon.formatting.big_number': ('formatting.html#big_number', 'archetypon/formatting.py'),
@@ -99,10 +223,68 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                     'archetypon/record_validation.py'),
                                               'archetypon.record_validation.TypedRecordFrame.__modify_schema__': ( 'record_validation.html#typedrecordframe.__modify_schema__',
                                                                                                                    'archetypon/record_validation.py'),
+                                              'archetypon.record_validation.TypedRecordFrame.validate': ( 'record_validation.html#typedrecordframe.validate',
+                                                                                                          'archetypon/record_validation.py'),
                                               'archetypon.record_validation.TypedRecordFrame.validate_column_names': ( 'record_validation.html#typedrecordframe.validate_column_names',
                                                                                                                        'archetypon/record_validation.py'),
+                                              'archetypon.record_validation.TypedRecordFrame.validate_iter': ( 'record_validation.html#typedrecordframe.validate_iter',
+                                                                                                               'archetypon/record_validation.py'),
                                               'archetypon.record_validation.TypedRecordFrame.validate_rows': ( 'record_validation.html#typedrecordframe.validate_rows',
                                                                                                                'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._CellByCell': ( 'record_validation.html#_cellbycell',
+                                                                                            'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._RowError': ( 'record_validation.html#_rowerror',
+                                                                                          'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._RowError.__init__': ( 'record_validation.html#_rowerror.__init__',
+                                                                                                   'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._RowModelPlan': ( 'record_validation.html#_rowmodelplan',
+                                                                                              'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._RowModelPlan.__init__': ( 'record_validation.html#_rowmodelplan.__init__',
+                                                                                                       'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._cast_date': ( 'record_validation.html#_cast_date',
+                                                                                           'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._cast_datetime': ( 'record_validation.html#_cast_datetime',
+                                                                                               'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._cast_float': ( 'record_validation.html#_cast_float',
+                                                                                            'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._cast_int': ( 'record_validation.html#_cast_int',
+                                                                                          'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._cast_lookup': ( 'record_validation.html#_cast_lookup',
+                                                                                             'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._cast_str': ( 'record_validation.html#_cast_str',
+                                                                                          'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._check_options': ( 'record_validation.html#_check_options',
+                                                                                               'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._column_caster': ( 'record_validation.html#_column_caster',
+                                                                                               'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._column_values': ( 'record_validation.html#_column_values',
+                                                                                               'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._constraint_mask': ( 'record_validation.html#_constraint_mask',
+                                                                                                 'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._handle_errors': ( 'record_validation.html#_handle_errors',
+                                                                                               'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._models_to_frame': ( 'record_validation.html#_models_to_frame',
+                                                                                                 'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._parse_chunk': ( 'record_validation.html#_parse_chunk',
+                                                                                             'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._parse_columns': ( 'record_validation.html#_parse_columns',
+                                                                                               'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._parse_in_parallel': ( 'record_validation.html#_parse_in_parallel',
+                                                                                                   'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._parse_rows': ( 'record_validation.html#_parse_rows',
+                                                                                            'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._row_errors': ( 'record_validation.html#_row_errors',
+                                                                                            'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._row_model_plan': ( 'record_validation.html#_row_model_plan',
+                                                                                                'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._rows_without_nulls': ( 'record_validation.html#_rows_without_nulls',
+                                                                                                    'archetypon/record_validation.py'),
+                                              'archetypon.record_validation._validate_cells': ( 'record_validation.html#_validate_cells',
+                                                                                                'archetypon/record_validation.py'),
+                                              'archetypon.record_validation.errors_to_frame': ( 'record_validation.html#errors_to_frame',
+                                                                                                'archetypon/record_validation.py'),
+                                              'archetypon.record_validation.parse_dataframe_columns_as': ( 'record_validation.html#parse_dataframe_columns_as',
+                                                                                                           'archetypon/record_validation.py'),
                                               'archetypon.record_validation.parse_dataframe_rows_as': ( 'record_validation.html#parse_dataframe_rows_as',
                                                                                                         'archetypon/record_validation.py'),
                                               'archetypon.record_validation.record_model': ( 'record_validation.html#record_model',
@@ -111,12 +293,50 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'archetypon/string_templating.py'),
                                               'archetypon.string_templating.StringTemplate.__init__': ( 'string_templating.html#stringtemplate.__init__',
                                                                                                         'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.StringTemplate.__init_subclass__': ( 'string_templating.html#stringtemplate.__init_subclass__',
+                                                                                                                 'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.StringTemplate._fields_model': ( 'string_templating.html#stringtemplate._fields_model',
+                                                                                                             'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.StringTemplate._string_values': ( 'string_templating.html#stringtemplate._string_values',
+                                                                                                              'archetypon/string_templating.py'),
                                               'archetypon.string_templating.StringTemplate.format_template': ( 'string_templating.html#stringtemplate.format_template',
                                                                                                                'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.StringTemplate.parse_many': ( 'string_templating.html#stringtemplate.parse_many',
+                                                                                                          'archetypon/string_templating.py'),
                                               'archetypon.string_templating.StringTemplate.parse_string': ( 'string_templating.html#stringtemplate.parse_string',
                                                                                                             'archetypon/string_templating.py'),
                                               'archetypon.string_templating.StringTemplate.validate_template': ( 'string_templating.html#stringtemplate.validate_template',
                                                                                                                  'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex': ( 'string_templating.html#templateindex',
+                                                                                              'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex.__init__': ( 'string_templating.html#templateindex.__init__',
+                                                                                                       'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex.__len__': ( 'string_templating.html#templateindex.__len__',
+                                                                                                      'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex.__repr__': ( 'string_templating.html#templateindex.__repr__',
+                                                                                                       'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex._mask': ( 'string_templating.html#templateindex._mask',
+                                                                                                    'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex._parse': ( 'string_templating.html#templateindex._parse',
+                                                                                                     'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex.add': ( 'string_templating.html#templateindex.add',
+                                                                                                  'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex.from_directory': ( 'string_templating.html#templateindex.from_directory',
+                                                                                                             'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex.query': ( 'string_templating.html#templateindex.query',
+                                                                                                    'archetypon/string_templating.py'),
+                                              'archetypon.string_templating.TemplateIndex.remove': ( 'string_templating.html#templateindex.remove',
+                                                                                                     'archetypon/string_templating.py'),
+                                              'archetypon.string_templating._field_regex': ( 'string_templating.html#_field_regex',
+                                                                                             'archetypon/string_templating.py'),
+                                              'archetypon.string_templating._separator': ( 'string_templating.html#_separator',
+                                                                                           'archetypon/string_templating.py'),
+                                              'archetypon.string_templating._strftime_regex': ( 'string_templating.html#_strftime_regex',
+                                                                                                'archetypon/string_templating.py'),
+                                              'archetypon.string_templating._template_regex': ( 'string_templating.html#_template_regex',
+                                                                                                'archetypon/string_templating.py'),
+                                              'archetypon.string_templating._typed_template_regex': ( 'string_templating.html#_typed_template_regex',
+                                                                                                      'archetypon/string_templating.py'),
                                               'archetypon.string_templating.get_formatters_from_string': ( 'string_templating.html#get_formatters_from_string',
                                                                                                            'archetypon/string_templating.py'),
                                               'archetypon.string_templating.string_to_dict': ( 'string_templating.html#string_to_dict',
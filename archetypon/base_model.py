@@ -1,17 +1,23 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_base_model.ipynb.
 
 # %% auto 0
-__all__ = ['DataFrame', 'BaseModel', 'GenericModel', 'DataFrameModel']
+__all__ = ['DataFrame', 'export_dbt_schema', 'BaseModel', 'GenericModel', 'DataFrameModel']
 
 # %% ../nbs/02_base_model.ipynb 2
 from typing import *
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic.generics import GenericModel as PydanticGenericModel
 import json
-from json2html import json2html
-from IPython.display import HTML,JSON
+import copy
+import html
+import re
+import uuid
 import inspect
-import yaml
+import importlib
+import pkgutil
+from types import ModuleType
+from pathlib import Path
+from functools import partial
 from archetypon.delegates import delegates
 import logging
 from pandas import DataFrame as PandasDataFrame
@@ -19,6 +25,23 @@ from pydantic import validator
 import pandas as pd
 
 # %% ../nbs/02_base_model.ipynb 4
+def _as_dataframe(v,copy:bool=False)->PandasDataFrame:
+    """
+    Coerce `v` to a DataFrame. 
+    
+    DataFrames (including subclasses) are passed through, or copied if `copy`. 
+    Arrow tables and dicts of arrays are converted without going through python objects.
+    """
+    if isinstance(v,PandasDataFrame):
+        return v.copy() if copy else v
+    # checked by module name so pyarrow isn't imported just to validate a model
+    if type(v).__module__.startswith('pyarrow') and hasattr(v,'to_pandas'):
+        return v.to_pandas()
+    if isinstance(v,dict):
+        return pd.DataFrame(v,copy=copy)
+    return pd.DataFrame(v)
+
+# %% ../nbs/02_base_model.ipynb 5
 class DataFrame(PandasDataFrame):
     """Subclassed from Pandas DataFrame. Includes classmethods used in Pydantic Validation"""
     
@@ -31,21 +54,44 @@ class DataFrame(PandasDataFrame):
         pass
     
     @classmethod
-    def validate_dataframe(cls,v):
-
-        return PandasDataFrame(v)
+    def validate_dataframe(cls,v,config=None):
+        """Existing DataFrames are passed through without a copy, unless the model's `Config.dataframe_copy` is True"""
+        return _as_dataframe(v,copy=getattr(config,'dataframe_copy',False))
 
-# %% ../nbs/02_base_model.ipynb 6
+# %% ../nbs/02_base_model.ipynb 7
 def dict_to_yaml(data: dict) -> str:
     # convert the dictionary to a yaml string
-    yaml_str = yaml.dump(data,sort_keys = False)
+    import yaml
+    # libyaml's dumper, where it's installed, is many times faster
+    yaml_str = yaml.dump(data,sort_keys = False,Dumper=getattr(yaml,'CSafeDumper',yaml.SafeDumper))
 
     return yaml_str
 
-# %% ../nbs/02_base_model.ipynb 7
+# %% ../nbs/02_base_model.ipynb 8
+def _schema_type(field: dict, definitions: dict):
+    "The json schema type of `field`, following `$ref`s into `definitions` and through `allOf`/`anyOf`/`oneOf`"
+    if 'type' in field:
+        return field['type']
+    if '$ref' in field:
+        return _schema_type(definitions[field['$ref'].split('/')[-1]],definitions)
+    for key in ('allOf','anyOf','oneOf'):
+        if key in field:
+            types = []
+            for t in (_schema_type(f,definitions) for f in field[key]):
+                if t not in types:
+                    types.append(t)
+            return types[0] if len(types)==1 else types
+    return None
+
 def pydantic_to_dbt(model: Type[PydanticBaseModel]) -> dict:
+    # built once for each class. Redefining a class makes a new class, so nothing stale is returned
+    if '__dbt_model__' in model.__dict__:
+        # a copy, so changes to the result don't leak into later calls
+        return copy.deepcopy(model.__dbt_model__)
+    
     # convert the model to a dictionary
     model_dict = model.schema()
+    definitions = model_dict.get('definitions',{})
 
     # create a dictionary for the dbt model
     dbt_model = {
@@ -57,17 +103,153 @@ def pydantic_to_dbt(model: Type[PydanticBaseModel]) -> dict:
     dbt_model = {k:v for k,v in dbt_model.items() if v or k=='columns'}
 
     # add the columns from the pydantic model to the dbt model
-    for field_name, field in model_dict["properties"].items():
+    for field_name, field in model_dict.get("properties",{}).items():
 
         column = {
             "name": field_name,
             "description":field.get('description'),
-            "type": field["type"],
+            "type": _schema_type(field,definitions),
         }
         dbt_model["columns"].append({k:v for k,v in column.items() if v})
-    return dbt_model
+    
+    model.__dbt_model__ = dbt_model
+    return copy.deepcopy(dbt_model)
 
-# %% ../nbs/02_base_model.ipynb 8
+# %% ../nbs/02_base_model.ipynb 9
+def _module_models(module: ModuleType) -> list:
+    "Pydantic models defined in `module`, and in its submodules if it's a package"
+    modules = [module]
+    if hasattr(module,'__path__'):
+        modules += [
+            importlib.import_module(info.name) 
+            for info in pkgutil.walk_packages(module.__path__,module.__name__+'.')
+        ]
+    return [
+        obj for m in modules for _,obj in inspect.getmembers(m,inspect.isclass)
+        if issubclass(obj,PydanticBaseModel) and obj.__module__==m.__name__
+    ]
+
+def export_dbt_schema(
+    models: Union[ModuleType,Iterable], # a module or package to search for models, or a list of models and modules
+    path: Union[str,Path] = None # where to write the yaml
+) -> str:
+    """
+    Build one dbt schema for many models, as `{"version": 2, "models": [...]}` yaml, and write it to `path` if given. 
+    
+    Each model's columns are built once per class and reused.
+    """
+    if isinstance(models,ModuleType):
+        models = [models]
+    # models found in modules map to True. A model can be reached from more than one module
+    found = {}
+    for m in models:
+        for model in (_module_models(m) if isinstance(m,ModuleType) else [m]):
+            found[model] = found.get(model,True) and isinstance(m,ModuleType)
+
+    dbt_models = []
+    for model,from_module in found.items():
+        try:
+            dbt_model = pydantic_to_dbt(model)
+        except ValueError as e:
+            # modules can hold models that aren't tables, e.g. ones with fields that have no json schema
+            if not from_module:
+                raise
+            logging.warning(f"Skipping {model.__module__}.{model.__name__}: {e}")
+            continue
+        dbt_models.append({k:v for k,v in dbt_model.items() if k!='version'})
+
+    schema_yml = dict_to_yaml({"version": 2, "models": dbt_models})
+    if path is not None:
+        Path(path).write_text(schema_yml)
+    return schema_yml
+
+# %% ../nbs/02_base_model.ipynb 11
+def _dataframe_to_json(df:PandasDataFrame):
+    "`Base`'s encoder for DataFrames that are encoded outside of `_json_dumps`"
+    return json.loads(df.to_json(date_format='iso'))
+
+def _is_stock_encoder(default:Callable,o)->bool:
+    "Whether pydantic's `default` encodes `o` with `Base`'s DataFrame encoder (or has none for it), rather than one from the model's `Config.json_encoders`"
+    if not (isinstance(default,partial) and default.args):
+        # an `encoder` passed to `.json()`
+        return False
+    encoders = default.args[0]
+    for base in type(o).__mro__[:-1]:
+        if base in encoders:
+            return encoders[base] is _dataframe_to_json
+    return True
+
+def _json_dumps(
+    obj,
+    *,
+    default:Callable,
+    orient:str = 'columns', # passed to DataFrame.to_json()
+    date_format:str = 'iso', # passed to DataFrame.to_json()
+    parts:list = None, # if passed, filled with json strings and (DataFrame,orient,date_format) tuples instead of returning a string
+    **dumps_kwargs
+)->str:
+    """`json.dumps` for pydantic's `Config.json_dumps`. Extra keyword arguments to `.json()` like `orient` and `date_format` are passed to `DataFrame.to_json()`. 
+    
+    DataFrames with their own encoder in the model's `Config.json_encoders` are encoded with it instead."""
+    placeholder = f'__dataframe_{uuid.uuid4().hex}_'
+    frames = []
+    def _default(o):
+        if isinstance(o,PandasDataFrame) and _is_stock_encoder(default,o):
+            frames.append(o)
+            return f'{placeholder}{len(frames)-1}__'
+        return default(o)
+
+    skeleton = json.dumps(obj,default=_default,**dumps_kwargs)
+    if not frames and parts is None:
+        return skeleton
+    # every other piece is the index of a DataFrame
+    pieces = re.split(f'"{placeholder}(\\d+)__"',skeleton)
+    output = [] if parts is None else parts
+    for n,piece in enumerate(pieces):
+        if n%2==0:
+            output.append(piece)
+        elif parts is None:
+            output.append(frames[int(piece)].to_json(orient=orient,date_format=date_format))
+        else:
+            output.append((frames[int(piece)],orient,date_format))
+    return ''.join(output) if parts is None else ''
+
+def _write_frame(fp,df:PandasDataFrame,orient:str,date_format:str,chunksize:int):
+    "Write `df.to_json()` to `fp`. With orient 'records' or 'values' the rows are written `chunksize` at a time"
+    if orient not in ('records','values') or len(df)<=chunksize:
+        fp.write(df.to_json(orient=orient,date_format=date_format))
+        return
+    fp.write('[')
+    for start in range(0,len(df),chunksize):
+        if start:
+            fp.write(',')
+        # strip the brackets from each chunk's list
+        fp.write(df.iloc[start:start+chunksize].to_json(orient=orient,date_format=date_format)[1:-1])
+    fp.write(']')
+
+# %% ../nbs/02_base_model.ipynb 13
+def _truncate_frame(
+    df:PandasDataFrame,
+    max_rows:int, # frames longer than this keep their first and last `max_rows//2` rows, like pandas' own display
+    max_columns:int, 
+    max_cell_chars:int # longer strings are cut short with '...'
+)->PandasDataFrame:
+    "The part of `df` that's displayed. Only the rows that are kept are looked at"
+    if len(df) > max_rows:
+        half = max_rows//2
+        df = pd.concat([df.iloc[:half],df.iloc[len(df)-half:]])
+    if df.shape[1] > max_columns:
+        df = df.iloc[:,:max_columns]
+    
+    cap = lambda x: x[:max_cell_chars-3]+'...' if isinstance(x,str) and len(x)>max_cell_chars else x
+    capped = {n:df.iloc[:,n].map(cap) for n in range(df.shape[1]) if df.dtypes.iloc[n]==object}
+    if capped:
+        df = df.copy()
+        for n,values in capped.items():
+            df.iloc[:,n] = values
+    return df
+
+# %% ../nbs/02_base_model.ipynb 14
 class Base():
 
     @delegates(PydanticBaseModel.json)
@@ -78,6 +260,8 @@ class Base():
         **kwargs
     ): 
         """Helper function to display json in jupyter lab using kwargs passed to pydantic's .json() method"""
+        # display libraries are imported when they're first used, so importing models stays fast
+        from IPython.display import JSON
         return JSON(
             json.loads(self.json(**kwargs),**json_loads_kwargs),
             **display_kwargs
@@ -85,6 +269,8 @@ class Base():
     
     @delegates(PydanticBaseModel.json)
     def display_html(self,**kwargs):
+        from IPython.display import HTML
+        from json2html import json2html
         return HTML(
             json2html.convert(self.json(**kwargs))
         )
@@ -93,6 +279,7 @@ class Base():
     @delegates(PydanticBaseModel.schema_json)
     def display_schema_json(cls,**kwargs):
         """Helper function to display schema json in jupyter lab using kwargs passed to pydantic's .json() method"""
+        from IPython.display import JSON
         return JSON(
             json.loads(cls.schema_json(**kwargs))
         )
@@ -100,6 +287,8 @@ class Base():
     @classmethod
     @delegates(PydanticBaseModel.schema_json)
     def schema_html(cls,**kwargs):
+        from IPython.display import HTML
+        from json2html import json2html
         return HTML(
             json2html.convert(cls.schema_json(**kwargs))
         )
@@ -111,16 +300,47 @@ class Base():
 
         return dict_to_yaml(dbt)
 
+    def _display_option(self,name:str):
+        "Options from `Display`, falling back to `Base.Display` for models that define their own `Display` without all of them"
+        return getattr(self.Display,name,getattr(Base.Display,name))
+
+    def _display_json_str(self,**kwargs)->str:
+        "The model's json with DataFrames cut down by `_truncate_frame`, for display"
+        parts = []
+        self.json(parts=parts,**kwargs)
+        truncate = partial(
+            _truncate_frame,
+            max_rows=self._display_option('max_rows'),
+            max_columns=self._display_option('max_columns'),
+            max_cell_chars=self._display_option('max_cell_chars')
+        )
+        return ''.join(
+            truncate(part[0]).to_json(orient=part[1],date_format=part[2]) if isinstance(part,tuple) else part
+            for part in parts
+        )
+
     def _repr_html_(self):
         try:
-            return self.display_html(**self.Display.html).data
+            from json2html import json2html
+            data = self._display_json_str(**self.Display.html)
+            max_bytes = self._display_option('max_bytes')
+            if len(data) > max_bytes:
+                return f'<pre>{html.escape(data[:max_bytes])}...</pre>'
+            return json2html.convert(data)
         except Exception as e:
             logging.warning(e)
             pass
 
     def _repr_json_(self):
         try:
-            return self.display_json(**self.Display.json).data
+            kwargs = dict(self.Display.json)
+            json_loads_kwargs = kwargs.pop('json_loads_kwargs',{})
+            kwargs.pop('display_kwargs',None)
+            data = self._display_json_str(**kwargs)
+            if len(data) > self._display_option('max_bytes'):
+                logging.warning(f"{type(self).__name__}'s json is longer than Display.max_bytes")
+                return None
+            return json.loads(data,**json_loads_kwargs)
         except Exception as e:
             logging.warning(e)
             pass
@@ -128,13 +348,37 @@ class Base():
     class Display:
         json = {}
         html = {}
+        max_rows = 10 # DataFrames longer than this show their first and last `max_rows//2` rows
+        max_columns = 20
+        max_cell_chars = 50
+        max_bytes = 1_000_000 # (roughly) the most a display can take up in a notebook
     
+    @delegates(PydanticBaseModel.json)
+    def json_stream(
+        self,
+        fp, # a file opened in text mode, a socket wrapper, or anything else with a `write` method
+        chunksize:int = 10_000, # rows written at a time for DataFrames with orient 'records' or 'values'
+        **kwargs
+    ):
+        """Write the model's json to `fp` piece by piece, so large DataFrames don't have to be held as one string"""
+        parts = []
+        self.json(parts=parts,**kwargs)
+        for part in parts:
+            if isinstance(part,tuple):
+                _write_frame(fp,*part,chunksize=chunksize)
+            else:
+                fp.write(part)
+
     class Config:
+        # copy DataFrames passed to DataFrame fields, rather than holding a reference to them
+        dataframe_copy = False
+        json_dumps = _json_dumps
+        # only used when DataFrames are encoded outside of `_json_dumps`
         json_encoders = {
-            PandasDataFrame: lambda df: json.loads(df.to_json(date_format='iso'))
+            PandasDataFrame: _dataframe_to_json
         }
 
-# %% ../nbs/02_base_model.ipynb 9
+# %% ../nbs/02_base_model.ipynb 15
 class BaseModel(PydanticBaseModel,Base):
     """
     Custom implementation of Pydantic's Base Model.
@@ -145,7 +389,7 @@ class BaseModel(PydanticBaseModel,Base):
     class Config(Base.Config):
         pass
 
-# %% ../nbs/02_base_model.ipynb 14
+# %% ../nbs/02_base_model.ipynb 24
 class GenericModel(PydanticGenericModel,Base):
     """
     Custom implementation of Pydantic's Generic Model.
@@ -157,31 +401,56 @@ class GenericModel(PydanticGenericModel,Base):
     class Config(Base.Config):
         pass
 
-# %% ../nbs/02_base_model.ipynb 19
+# %% ../nbs/02_base_model.ipynb 31
 DataFrameT = TypeVar('DataFrameT')
 
-# %% ../nbs/02_base_model.ipynb 20
+# %% ../nbs/02_base_model.ipynb 32
 class DataFrameModel(GenericModel,Generic[DataFrameT]):
     """Generic DataFrame model. Anything passed to the 'data' attribute will be parsed as a DataFrame"""
     data: DataFrameT = None
     
     @validator('data',pre=True,always=True)
-    def create_dataframe(cls,v):
-        return pd.DataFrame(v)
+    def create_dataframe(cls,v,config):
+        return _as_dataframe(v,copy=config.dataframe_copy)
     
     # @delegates(PydanticBaseModel.dict)
     # def to_df(self,**kwargs):
     #     """convert data to dataframe with **kwargs from Pydantics .dict() method"""
     #     return 
     
+    @classmethod
+    def _schema_html(cls)->str:
+        "Headers for the schema's title and description. Built once for each class"
+        if '__schema_html__' not in cls.__dict__:
+            schema = cls.schema()
+            cls.__schema_html__ = ''.join(
+                f"<header><b>{schema_field}</b>: {schema[schema_field]}\n</header>"
+                for schema_field in ['title','description']
+            )
+        return cls.__schema_html__
+
+    def _data_html(self)->str:
+        "`self.data` as html, within the limits set in `Display`. Rows are halved until the html fits in `max_bytes`"
+        max_rows,max_bytes = self._display_option('max_rows'),self._display_option('max_bytes')
+        with pd.option_context('display.max_colwidth',self._display_option('max_cell_chars')):
+            while True:
+                df_html = self.data.to_html(
+                    max_rows=max_rows,
+                    max_cols=self._display_option('max_columns'),
+                    show_dimensions='truncate',
+                    notebook=True
+                )
+                if len(df_html) <= max_bytes or max_rows <= 2:
+                    break
+                max_rows //= 2
+        if len(df_html) > max_bytes:
+            return f'<p>{self.data.shape[0]} rows × {self.data.shape[1]} columns</p>'
+        return df_html
+
     def _repr_html_(self):
         
-        df_html = self.data._repr_html_()
-        schema = self.schema()
-        html_fields = [
-            f"<header><b>{schema_field}</b>: {schema[schema_field]}\n</header>"
-            for schema_field in ['title','description']
-        ]
+        df_html = self._data_html()
+        html_fields = [self._schema_html()]
         for field in self.__fields__.keys():
             if field!='data':
                 html_fields.append(
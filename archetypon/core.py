@@ -4,6 +4,17 @@
 __all__ = []
 
 # %% ../nbs/00_core.ipynb 2
-from archetypon.base_model import BaseModel,DataFrame,DataFrameModel
-from archetypon.record_validation import RecordFrame
-import pandas as pd
+import importlib
+
+# attributes imported on first use, so `import archetypon.core` doesn't load pandas, pydantic and friends up front
+_lazy_attributes = {
+    'BaseModel':'archetypon.base_model',
+    'DataFrame':'archetypon.base_model',
+    'DataFrameModel':'archetypon.base_model',
+    'RecordFrame':'archetypon.record_validation',
+}
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        return getattr(importlib.import_module(_lazy_attributes[name]),name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,13 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_database.ipynb.
 
 # %% auto 0
-__all__ = ['Database', 'SnowflakeDatabase']
+__all__ = ['QueryCache', 'Database', 'SnowflakeDatabase']
 
 # %% ../nbs/04_database.ipynb 2
 from archetypon.delegates import delegates
 import os
 import pandas as pd
 from typing import Any,Type,Union,Callable,Optional
-from snowflake.sqlalchemy import URL as SnowflakeURL
 from pydantic import SecretStr,Field,FilePath
 from typing import Optional
 from pathlib import Path
@@ -24,8 +23,103 @@ from sqlalchemy import Sequence
 from abc import ABC, abstractproperty,abstractmethod
 from sqlalchemy.engine.url import URL
 from pydantic import BaseSettings
+from typing import Iterator
+from sqlalchemy.pool import NullPool
+import threading
+import io
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor,Executor
+from typing import Dict
+from collections import OrderedDict
+import hashlib
+import re
+import time
+from sqlalchemy import text,bindparam
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic.fields import SHAPE_SINGLETON
+from archetypon.record_validation import parse_dataframe_columns_as,_rows_without_nulls
+from collections.abc import Mapping
+from sqlalchemy import inspect
+from sqlalchemy.exc import NoSuchTableError
+import pickle
+from typing import Iterable
+from sqlalchemy import Table
+from archetypon.record_validation import RecordFrame,TypedRecordFrame
 
 # %% ../nbs/04_database.ipynb 3
+_engines = {}
+_engines_lock = threading.Lock()
+
+def _shared_engine(url,**options)->Engine:
+    "An engine for `url` and `options`, shared by every database object that asks for the same ones"
+    # the password is part of the key, so different credentials never share a pool
+    rendered = url.render_as_string(hide_password=False) if isinstance(url,URL) else str(url)
+    key = (rendered,tuple(sorted(options.items(),key=lambda kv: kv[0])))
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = create_engine(url,**options)
+        return _engines[key]
+
+# %% ../nbs/04_database.ipynb 4
+def _is_int_field(field)->bool:
+    return (
+        field.shape==SHAPE_SINGLETON and isinstance(field.type_,type) 
+        and issubclass(field.type_,int) and not issubclass(field.type_,bool)
+    )
+
+def _rows_as(model,columns:list,rows:list)->list:
+    "`rows` as `model`s. Pydantic models are validated a column at a time, with `parse_dataframe_columns_as`, rather than row by row"
+    if not (isinstance(model,type) and issubclass(model,PydanticBaseModel)):
+        return [model(row) for row in rows]
+    if any(isinstance(f.type_,type) and issubclass(f.type_,PydanticBaseModel) for f in model.__fields__.values()):
+        # nested models aren't rebuilt by `construct`. Null cells are left out, so they're missing values, as in a RecordFrame
+        return [model.parse_obj(row) for row in _rows_without_nulls(pd.DataFrame.from_records(rows,columns=columns))]
+    validated = parse_dataframe_columns_as(model,pd.DataFrame.from_records(rows,columns=columns))
+    for field in model.__fields__.values():
+        column = field.alias if field.alias in validated.columns else field.name
+        # integers with nulls come back as floats
+        if column in validated.columns and _is_int_field(field) and validated[column].dtype.kind=='f':
+            validated[column] = validated[column].astype('Int64')
+    values = validated.astype(object).where(validated.notna(),None).to_numpy()
+    # already validated, so skip validating again. Nulls are left out, so fields get their defaults and `__fields_set__` matches `parse_obj`
+    return [model.construct(**{k:v for k,v in zip(validated.columns,row) if v is not None}) for row in values]
+
+# %% ../nbs/04_database.ipynb 5
+_reflection_lock = threading.Lock()
+
+class _LazyTables(Mapping):
+    "The tables of a database, each reflected the first time it's looked up. Names can be qualified with a schema, e.g. 'schema.table'"
+    def __init__(self,db):
+        self.db = db
+
+    def __getitem__(self,name:str)->Table:
+        schema,_,table = name.rpartition('.')
+        metadata = self.db.metadata
+        if name not in metadata.tables:
+            with _reflection_lock:
+                if name not in metadata.tables:
+                    try:
+                        Table(table,metadata,schema=schema or None,autoload_with=self.db.engine)
+                    except NoSuchTableError:
+                        raise KeyError(name) from None
+                    self.db._save_metadata()
+        return metadata.tables[name]
+
+    def _names(self)->list:
+        # listing names is cheap, unlike reflecting every table
+        return inspect(self.db.engine).get_table_names()
+
+    def __iter__(self):
+        return iter(self._names())
+
+    def __len__(self):
+        return len(self._names())
+
+    def __repr__(self):
+        return f"<tables: {', '.join(self._names())}>"
+
+# %% ../nbs/04_database.ipynb 6
 class AbstractDatabaseClass(ABC):
 
     """
@@ -46,23 +140,247 @@ class AbstractDatabaseClass(ABC):
     def query_to_records(
         self,
         query_string:str,
-        model:Union[Type,Callable]=dict
+        model:Union[Type,Callable]=dict, # called on each row, or a pydantic model to validate the rows with
+        params:Optional[dict]=None # bound to `:name` parameters in `query_string`
     ):
+        """The rows of a query as `model`s. 
+        
+        Pydantic models are validated a column at a time (see `parse_dataframe_columns_as`), so nulls are treated as missing values, as in a `RecordFrame`."""
         with self.engine.connect() as conn:
-            results = [model(row) for row in conn.execute(query_string).fetchall()]
+            result = conn.execute(query_string) if params is None else conn.execute(text(query_string),params)
+            results = _rows_as(model,list(result.keys()),result.fetchall())
         return results
 
+    def query_many(
+        self,
+        query_string:str, # a query with an expanding `IN :keys` parameter, e.g. "select * from users where id in :keys"
+        keys:Iterable, # values to look up
+        model:Union[Type,Callable]=dict,
+        batch_size:int=1_000, # keys per query
+        params:Optional[dict]=None, # other parameters of the query
+        key_param:str='keys' # name of the expanding parameter
+    )->list:
+        "Looks up many `keys` with one query per `batch_size` of them, rather than one query per key"
+        keys = list(keys)
+        statement = text(query_string).bindparams(bindparam(key_param,expanding=True))
+        results = []
+        with self.engine.connect() as conn:
+            for i in range(0,len(keys),batch_size):
+                result = conn.execute(statement,{**(params or {}),key_param:keys[i:i+batch_size]})
+                results.extend(_rows_as(model,list(result.keys()),result.fetchall()))
+        return results
+
+    def iter_records(
+        self,
+        query_string:str,
+        model:Union[Type,Callable]=dict,
+        batch_size:int=10_000
+    )->Iterator:
+        """Like `query_to_records`, but yields the records as they're fetched, `batch_size` rows at a time. 
+        
+        Results are streamed with a server-side cursor if the driver supports one, so memory use depends on `batch_size` rather than the size of the result."""
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(query_string)
+            columns = list(result.keys())
+            for rows in result.partitions(batch_size):
+                yield from _rows_as(model,columns,rows)
+
+    @delegates(pd.read_sql_query)
+    def iter_df(
+        self,
+        query_string,
+        chunksize:int=10_000,
+        model:Optional[Type]=None, # a pydantic model or `RecordFrame[...]` to validate each chunk with
+        **kwargs
+    )->Iterator[pd.DataFrame]:
+        """Like `query_to_df`, but yields DataFrames of `chunksize` rows as they're fetched, streamed with a server-side cursor if the driver supports one.
+        
+        Chunks are validated as they're read if a `model` is given. See `TypedRecordFrame.validate_iter` for how errors are reported."""
+        with self.engine.connect() as conn:
+            chunks = pd.read_sql_query(
+                query_string,
+                conn.execution_options(stream_results=True),
+                chunksize=chunksize,
+                **kwargs
+            )
+            if model is not None:
+                record_frame = model if issubclass(model,TypedRecordFrame) else RecordFrame[model]
+                chunks = record_frame.validate_iter(chunks)
+            yield from chunks
+
+    def iter_arrow_batches(
+        self,
+        query_string:str,
+        batch_size:int=10_000
+    )->Iterator:
+        """Yields the result of a query as `pyarrow.Table`s of up to `batch_size` rows. 
+        
+        Built from batches of the DBAPI cursor. Subclasses override this with a native Arrow path where the driver has one (see `SnowflakeDatabase`)."""
+        import pyarrow as pa
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(query_string)
+            columns = list(result.keys())
+            for rows in result.partitions(batch_size):
+                yield pa.Table.from_pydict(dict(zip(columns,zip(*rows))))
+
+    def _read_df(self,query_string,engine,**kwargs)->pd.DataFrame:
+        # there's no native arrow path in general, so both engines read through SQLAlchemy
+        with self.engine.connect() as conn:
+            df = pd.read_sql_query(query_string,conn,**kwargs)
+        return df
+
+    def _cache_key(self,query_string,engine,**kwargs)->str:
+        return self.cache.key(query_string,self.engine.url.render_as_string(hide_password=False),engine=engine,**kwargs)
+
     @delegates(pd.read_sql_query)
     def query_to_df(
         self,
         query_string,
+        engine:Literal['sqlalchemy','arrow']='sqlalchemy', # 'arrow' uses the driver's Arrow result format if it has one (e.g. Snowflake)
         **kwargs
     ):
         f"""{pd.read_sql_query.__doc__}"""
-        with self.engine.connect() as conn:
-            df = pd.read_sql_query(query_string,conn,**kwargs)
+        if getattr(self,'cache',None) is None or 'chunksize' in kwargs:
+            return self._read_df(query_string,engine,**kwargs)
+        key = self._cache_key(query_string,engine,**kwargs)
+        df = self.cache.get(key)
+        if df is None:
+            df = self._read_df(query_string,engine,**kwargs)
+            self.cache.put(key,df)
         return df
 
+    def invalidate_cache(
+        self,
+        query_string:Optional[str]=None, # the query to forget, or everything if None
+        engine:Literal['sqlalchemy','arrow']='sqlalchemy',
+        **kwargs # the other arguments the query was run with
+    ):
+        "Removes cached results of `query_to_df`"
+        if getattr(self,'cache',None) is None:
+            return
+        self.cache.invalidate(None if query_string is None else self._cache_key(query_string,engine,**kwargs))
+
+    async def aquery_to_records(
+        self,
+        query_string:str,
+        model:Union[Type,Callable]=dict,
+        params:Optional[dict]=None, # bound to `:name` parameters in `query_string`
+        executor:Optional[Executor]=None # runs the query, defaults to the event loop's default executor
+    ):
+        "`query_to_records` in a thread, so other queries can run while it waits on the database"
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor,partial(self.query_to_records,query_string,model,params))
+
+    @delegates(pd.read_sql_query)
+    async def aquery_to_df(
+        self,
+        query_string,
+        executor:Optional[Executor]=None, # runs the query, defaults to the event loop's default executor
+        **kwargs
+    )->pd.DataFrame:
+        "`query_to_df` in a thread, so other queries can run while it waits on the database"
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor,partial(self.query_to_df,query_string,**kwargs))
+
+    @delegates(pd.read_sql_query)
+    async def gather_queries(
+        self,
+        queries:Dict[str,str], # {name: query}
+        max_concurrency:int=8, # most queries to run at once. Each one holds a connection from the pool
+        **kwargs
+    )->Dict[str,pd.DataFrame]:
+        """Runs `queries` concurrently and returns {name: DataFrame}, so the time taken is bounded by the slowest query rather than the sum of them. 
+        
+        Works with any driver: queries run in a thread pool, not on an async engine. If a query fails (or this is cancelled), queries that haven't started are cancelled."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        async def run(query_string):
+            async with semaphore:
+                return await self.aquery_to_df(query_string,executor=executor,**kwargs)
+        
+        tasks = [asyncio.ensure_future(run(q)) for q in queries.values()]
+        try:
+            dfs = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            # queries that are still running finish in their threads. Waiting for them here would block the event loop
+            executor.shutdown(wait=False)
+        return dict(zip(queries,dfs))
+
+    def _insert_batch(self,conn,table:Table,batch:pd.DataFrame):
+        # python objects with None for nulls, since most drivers can't bind numpy scalars or NaN
+        values = batch.astype(object).where(batch.notna(),None).to_numpy()
+        columns = list(batch.columns)
+        conn.execute(table.insert(),[dict(zip(columns,row)) for row in values])
+
+    def _copy_batch(self,conn,table:Table,batch:pd.DataFrame):
+        # `copy_expert` is psycopg2's, which `_batch_writer` checks for before anything is written
+        preparer = conn.dialect.identifier_preparer
+        columns = ','.join(preparer.quote(c) for c in batch.columns)
+        buffer = io.StringIO()
+        # \N for nulls, so empty strings stay empty strings
+        batch.to_csv(buffer,index=False,header=False,na_rep='\\N')
+        buffer.seek(0)
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+        finally:
+            cursor.close()
+
+    def _batch_writer(self,method:str)->Callable:
+        "The function that writes a batch with `method`. Raises a `ValueError` if this database can't use it, before anything is written"
+        dialect = self.engine.dialect
+        supported = {
+            'executemany':True,
+            'copy':(dialect.name,dialect.driver)==('postgresql','psycopg2'),
+            # only databases that load through a stage (i.e. `SnowflakeDatabase`) define `_stage_batch`
+            'stage':hasattr(self,'_stage_batch')
+        }
+        if method not in supported:
+            raise ValueError(f"method must be 'executemany', 'copy' or 'stage', not '{method}'")
+        if not supported[method]:
+            if method=='stage':
+                raise ValueError(f"method='stage' needs a SnowflakeDatabase, not {type(self).__name__}")
+            raise ValueError(f"method='copy' needs a postgresql+psycopg2 database, not {dialect.name}+{dialect.driver}")
+        return getattr(self,{'executemany':'_insert_batch','copy':'_copy_batch','stage':'_stage_batch'}[method])
+
+    def write_df(
+        self,
+        df:Union[pd.DataFrame,Iterable[pd.DataFrame]], # a DataFrame, or DataFrames to write one after the other (e.g. from `iter_df`)
+        table:str,
+        method:Literal['executemany','copy','stage']='executemany', # 'copy' uses Postgres' `COPY FROM STDIN` (with psycopg2), 'stage' loads through a Snowflake stage
+        batch_size:int=10_000,
+        model:Optional[Type]=None, # a pydantic model or `RecordFrame[...]` to validate each batch with before it's written
+        if_exists:Literal['fail','replace','append']='append', # what to do if `table` exists, as in `DataFrame.to_sql`
+        schema:str=None
+    )->int:
+        """Writes DataFrames to `table` in batches of `batch_size` rows, and returns the number of rows written. 
+        
+        The table is created from the first batch if it doesn't exist. Everything is written in one transaction, so if a batch fails validation (see `TypedRecordFrame.validate_iter`) nothing is written, 
+        except with `method='stage'`: Snowflake commits implicitly when the stage is created, so the table and the batches loaded before the failure are kept."""
+        write = self._batch_writer(method)
+        frames = [df] if isinstance(df,pd.DataFrame) else df
+        batches = (frame.iloc[i:i+batch_size] for frame in frames for i in range(0,len(frame),batch_size))
+        if model is not None:
+            record_frame = model if issubclass(model,TypedRecordFrame) else RecordFrame[model]
+            batches = record_frame.validate_iter(batches)
+        written = 0
+        with self.engine.begin() as conn:
+            sql_table = None
+            for batch in batches:
+                if sql_table is None:
+                    batch.head(0).to_sql(table,conn,schema=schema,if_exists=if_exists,index=False)
+                    sql_table = Table(table,MetaData(),schema=schema,autoload_with=conn)
+                write(conn,sql_table,batch)
+                written += len(batch)
+        return written
+
     @contextmanager
     def session_scope(self,bind=None,**kwargs):
         """Provide a transactional scope around a series of operations."""
@@ -78,8 +396,45 @@ class AbstractDatabaseClass(ABC):
             session.close()
     
     @property
-    def tables(self):
-        return self.metadata.tables
+    def tables(self)->Mapping:
+        "The database's tables, reflected as they're looked up, e.g. `db.tables['users']`"
+        return _LazyTables(self)
+
+    def _metadata_file(self)->Optional[Path]:
+        if getattr(self,'metadata_cache',None) is None:
+            return None
+        # the url includes the database and schema
+        key = hashlib.sha256(self.engine.url.render_as_string(hide_password=False).encode()).hexdigest()
+        return Path(self.metadata_cache)/f'{key}.pickle'
+
+    def _load_metadata(self)->MetaData:
+        "Reflected tables from `metadata_cache` if they're newer than `metadata_max_age`, or else an empty `MetaData`"
+        file = self._metadata_file()
+        cached = None
+        if file is not None and file.exists():
+            try:
+                with open(file,'rb') as f:
+                    cached = pickle.load(f)
+            except (OSError,pickle.UnpicklingError,EOFError,AttributeError,ImportError):
+                # truncated files, or ones pickled by another version of SQLAlchemy, are stale and rebuilt as tables are reflected
+                cached = None
+        if cached is not None and time.time()-cached['reflected_at']<=self.metadata_max_age:
+            # `MetaData.info` isn't pickled
+            cached['metadata'].info['reflected_at'] = cached['reflected_at']
+            return cached['metadata']
+        metadata = MetaData()
+        metadata.info['reflected_at'] = time.time()
+        return metadata
+
+    def _save_metadata(self):
+        file = self._metadata_file()
+        if file is None:
+            return
+        file.parent.mkdir(parents=True,exist_ok=True)
+        temporary = file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temporary,'wb') as f:
+            pickle.dump({'reflected_at':self.metadata.info['reflected_at'],'metadata':self.metadata},f)
+        temporary.replace(file)
 
     def __repr__(self):
         return (
@@ -90,12 +445,155 @@ class AbstractDatabaseClass(ABC):
                 ]).strip(' ,')+'>'
         )
 
-# %% ../nbs/04_database.ipynb 5
+# %% ../nbs/04_database.ipynb 7
+class QueryCache:
+    """Caches the results of `query_to_df`: in memory up to `max_bytes`, evicting the least recently used first, and as Parquet files in `path` if it's given.
+    
+    Results older than `ttl` seconds are treated as missing. `hits` and `misses` count lookups."""
+    def __init__(
+        self,
+        max_bytes:int=256*2**20,
+        path:Union[str,Path,None]=None, # a directory to keep results in across processes
+        ttl:Optional[float]=None,
+        max_disk_bytes:Optional[int]=None # removes the oldest files in `path` beyond this
+    ):
+        self.max_bytes,self.ttl,self.max_disk_bytes = max_bytes,ttl,max_disk_bytes
+        self.path = None if path is None else Path(path)
+        if self.path is not None:
+            self.path.mkdir(parents=True,exist_ok=True)
+        self.hits = self.misses = 0
+        self._memory = OrderedDict() # key -> (time cached, size in bytes, DataFrame)
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query_string:str,url:str,**kwargs)->str:
+        "A hash of the query with whitespace normalized (outside of quotes), the database url and the other arguments of the query"
+        parts = re.split(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""",query_string)
+        sql = ''.join(p if i%2 else re.sub(r'\s+',' ',p) for i,p in enumerate(parts)).strip().rstrip(';').strip()
+        return hashlib.sha256(repr((sql,url,sorted(kwargs.items()))).encode()).hexdigest()
+
+    def _file(self,key:str)->Optional[Path]:
+        return None if self.path is None else self.path/f'{key}.parquet'
+
+    def _expired(self,cached_at:float)->bool:
+        return self.ttl is not None and time.time()-cached_at>self.ttl
+
+    def _forget(self,key:str):
+        cached = self._memory.pop(key,None)
+        if cached is not None:
+            self._memory_bytes -= cached[1]
+
+    def _remember(self,key:str,df:pd.DataFrame,cached_at:float):
+        self._forget(key)
+        size = int(df.memory_usage(index=True,deep=True).sum())
+        if size>self.max_bytes:
+            return
+        self._memory[key] = (cached_at,size,df)
+        self._memory_bytes += size
+        while self._memory_bytes>self.max_bytes:
+            self._forget(next(iter(self._memory)))
+
+    def _lookup(self,key:str)->Optional[pd.DataFrame]:
+        if key in self._memory:
+            cached_at,_,df = self._memory[key]
+            if not self._expired(cached_at):
+                self._memory.move_to_end(key)
+                return df
+            self._forget(key)
+        file = self._file(key)
+        if file is None:
+            return None
+        try:
+            cached_at = file.stat().st_mtime
+            if not self._expired(cached_at):
+                df = pd.read_parquet(file)
+                self._remember(key,df,cached_at)
+                return df
+            file.unlink()
+        except (OSError,ValueError,ImportError):
+            # missing (e.g. removed by another process) or unreadable files are misses
+            pass
+        return None
+
+    def get(self,key:str)->Optional[pd.DataFrame]:
+        "A copy of the cached result, or None"
+        with self._lock:
+            df = self._lookup(key)
+            if df is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return df.copy()
+
+    def _evict_files(self):
+        if self.max_disk_bytes is None:
+            return
+        files = sorted(self.path.glob('*.parquet'),key=lambda f: f.stat().st_mtime)
+        total = sum(f.stat().st_size for f in files)
+        for f in files:
+            if total<=self.max_disk_bytes:
+                break
+            total -= f.stat().st_size
+            f.unlink()
+
+    def put(self,key:str,df:pd.DataFrame):
+        df = df.copy()
+        with self._lock:
+            self._remember(key,df,time.time())
+            file = self._file(key)
+            if file is None:
+                return
+            # written to a temporary file first, so other processes never read half a file
+            temporary = file.with_suffix(f'.{os.getpid()}.tmp')
+            try:
+                df.to_parquet(temporary)
+            except (ImportError,ValueError,TypeError,NotImplementedError):
+                # e.g. object columns of mixed types, which only stay in memory
+                for f in (temporary,file):
+                    if f.exists():
+                        f.unlink()
+                return
+            os.replace(temporary,file)
+            self._evict_files()
+
+    def invalidate(self,key:Optional[str]=None):
+        "Removes `key`, or everything if it's None"
+        with self._lock:
+            keys = list(self._memory) if key is None else [key]
+            for k in keys:
+                self._forget(k)
+            if self.path is None:
+                return
+            files = self.path.glob('*.parquet') if key is None else [self._file(key)]
+            for f in files:
+                if f.exists():
+                    f.unlink()
+
+# %% ../nbs/04_database.ipynb 9
 class DatabaseCredentialsBase(BaseSettings):
     username: str = None
     password: SecretStr = ''
+    # connection pool, passed to `create_engine`. Unset options use SQLAlchemy's defaults for the dialect
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_pre_ping: Optional[bool] = None
+    pool_recycle: Optional[int] = None
+    null_pool: bool = Field(False,description="open a new connection for every checkout instead of pooling them")
+    # reflected tables
+    metadata_cache: Optional[Path] = Field(None,description="a directory to keep reflected tables in between processes")
+    metadata_max_age: float = Field(24*60*60,description="seconds before cached tables are reflected again")
 
-# %% ../nbs/04_database.ipynb 6
+    def _engine_options(self)->dict:
+        options = {
+            k:v for k,v in self.dict(include={'pool_size','max_overflow','pool_pre_ping','pool_recycle'}).items()
+            if v is not None
+        }
+        if self.null_pool:
+            options['poolclass'] = NullPool
+        return options
+
+# %% ../nbs/04_database.ipynb 10
 class DatabaseCredentials(DatabaseCredentialsBase):
     """ Passed to regular SQLAlchemy URL constructor"""
     drivername: str
@@ -104,7 +602,7 @@ class DatabaseCredentials(DatabaseCredentialsBase):
     query:str = None
     database:str = None
 
-# %% ../nbs/04_database.ipynb 7
+# %% ../nbs/04_database.ipynb 11
 class SnowflakeCredentials(DatabaseCredentialsBase):
     """Passed to special Snowflake URL constructor"""
     account: str
@@ -120,13 +618,14 @@ class SnowflakeCredentials(DatabaseCredentialsBase):
     numpy: Optional[bool]
         
 
-# %% ../nbs/04_database.ipynb 8
+# %% ../nbs/04_database.ipynb 12
 class Database(DatabaseCredentials,AbstractDatabaseClass):
     f"""{URL.__doc__}"""
 
     engine:Engine = None
     engine_url:URL = None
     metadata:MetaData = None
+    cache:QueryCache = None # set to cache the results of `query_to_df`
 
     def __init__(
         self,
@@ -144,8 +643,8 @@ class Database(DatabaseCredentials,AbstractDatabaseClass):
             query=self.query
         )
         self.engine_url=url
-        self.engine=create_engine(url)
-        self.metadata = MetaData()
+        self.engine=_shared_engine(url,**self._engine_options())
+        self.metadata = self._load_metadata()
 
     class Config:
         arbitrary_types_allowed=True
@@ -159,11 +658,12 @@ class Database(DatabaseCredentials,AbstractDatabaseClass):
                 ]).strip(' ,')+'>'
         )
 
-# %% ../nbs/04_database.ipynb 9
+# %% ../nbs/04_database.ipynb 13
 class SnowflakeDatabase(SnowflakeCredentials,AbstractDatabaseClass):
     engine_url: URL = None
     engine: Engine = None
     metadata: MetaData = None
+    cache: QueryCache = None
 
 
     def __init__(
@@ -171,6 +671,8 @@ class SnowflakeDatabase(SnowflakeCredentials,AbstractDatabaseClass):
         **kwargs
     ):
         super().__init__(**kwargs)
+        # imported here, so the snowflake connector is only loaded by those who use it
+        from snowflake.sqlalchemy import URL as SnowflakeURL
         self.engine_url = SnowflakeURL(
             user = self.username,
             password = self.password.get_secret_value(),
@@ -182,12 +684,67 @@ class SnowflakeDatabase(SnowflakeCredentials,AbstractDatabaseClass):
             numpy = self.numpy
         )
 
-        self.engine=create_engine(self.engine_url)
-        self.metadata = MetaData()
+        self.engine=_shared_engine(self.engine_url,**self._engine_options())
+        self.metadata = self._load_metadata()
 
     class Config:
         arbitrary_types_allowed=True
 
+    @contextmanager
+    def _cursor(self,query_string:str):
+        "A Snowflake cursor that has executed `query_string`"
+        with self.engine.connect() as conn:
+            cursor = conn.connection.cursor()
+            try:
+                cursor.execute(query_string)
+                yield cursor
+            finally:
+                cursor.close()
+
+    def _normalize_columns(self,table):
+        "Names `table`'s columns the way the SQLAlchemy dialect does (case insensitive names in lower case), so every read method agrees"
+        return table.rename_columns([self.engine.dialect.normalize_name(c) for c in table.column_names])
+
+    def _arrow_to_df(self,table)->pd.DataFrame:
+        table = self._normalize_columns(table)
+        # split_blocks and self_destruct avoid copying columns into consolidated blocks, and release arrow memory as columns are converted
+        return table.to_pandas(split_blocks=True,self_destruct=True)
+
+    def iter_arrow_batches(
+        self,
+        query_string:str,
+        batch_size:int=None # unused, Snowflake decides the size of result batches
+    )->Iterator:
+        """Yields the result of a query as `pyarrow.Table`s, straight from Snowflake's Arrow result format. Requires `snowflake-connector-python[pandas]`"""
+        with self._cursor(query_string) as cursor:
+            for batch in cursor.fetch_arrow_batches():
+                yield self._normalize_columns(batch)
+
+    def _read_df(self,query_string,engine,**kwargs)->pd.DataFrame:
+        # the arrow engine reads Snowflake's Arrow result format, which is much faster than converting rows of Python objects
+        if engine!='arrow':
+            return super()._read_df(query_string,engine,**kwargs)
+        if kwargs:
+            raise TypeError(f"{', '.join(kwargs)} not supported with engine='arrow'")
+        with self._cursor(query_string) as cursor:
+            table = cursor.fetch_arrow_all()
+            if table is None:
+                # no rows
+                return pd.DataFrame(columns=[self.engine.dialect.normalize_name(c.name) for c in cursor.description])
+        return self._arrow_to_df(table)
+
+    def _stage_batch(self,conn,table:Table,batch:pd.DataFrame):
+        # PUT the batch to a temporary stage as compressed parquet, then COPY INTO the table
+        from snowflake.connector.pandas_tools import write_pandas
+        write_pandas(
+            conn.connection.dbapi_connection,
+            batch,
+            table.name,
+            schema=table.schema,
+            compression='snappy',
+            quote_identifiers=False
+        )
+
     def __repr__(self):
         return (
             "<Snowflake Database: " +"".join(
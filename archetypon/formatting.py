@@ -9,7 +9,8 @@ from typing import (
     Callable,
     TypeVar,
     Literal,
-    List
+    List,
+    Dict
 )
 from archetypon.base_model import *
 from pydantic import root_validator
@@ -18,36 +19,108 @@ import math
 from pandas import isnull
 import pandas as pd
 import datetime as dt
+import numpy as np
+import string
+from functools import lru_cache
+import html
+from typing import Optional
 
 # %% ../nbs/05_formatting.ipynb 5
 FormatterT = TypeVar("FormatterT",str,Callable)
 
+def _compile_format(template:str)->Callable:
+    """`template.format`, parsed once. 
+    
+    A template with one replacement field (e.g. "${:,.0f}") becomes `prefix + format(val,spec) + suffix`, so the spec isn't parsed on every call."""
+    parts = list(string.Formatter().parse(template))
+    if len(parts) in (1,2) and parts[0][1] in ('','0') and parts[0][3] is None and '{' not in parts[0][2]:
+        if len(parts)==1 or parts[1][1] is None:
+            prefix,_,spec,_ = parts[0]
+            suffix = parts[1][0] if len(parts)==2 else ''
+            if not prefix and not suffix:
+                return lambda val: format(val,spec)
+            return lambda val: prefix+format(val,spec)+suffix
+    return template.format
+
+def _is_null(val)->bool:
+    "`val=='' or isnull(val)`, with shortcuts for floats and ints, which `isnull` is slow to check"
+    if type(val) is float:
+        return val!=val
+    if type(val) is int:
+        return False
+    return val=='' or isnull(val)
+
+# vectorized versions of formatting functions, which take and return arrays of non-null values
+_array_formats = {}
+
+def _format_array(values,format_values:Callable,null_format:str):
+    "Formats a Series or array with `format_values`, replacing nulls (and empty strings) with `null_format`"
+    series = values if isinstance(values,pd.Series) else pd.Series(values)
+    nulls = series.isna().to_numpy()
+    objects = series.to_numpy(dtype=object)
+    if series.dtype==object:
+        nulls |= objects==''
+    formatted = np.full(len(objects),null_format,dtype=object)
+    if not nulls.all():
+        formatted[~nulls] = format_values(objects[~nulls])
+    if isinstance(values,pd.Series):
+        return pd.Series(formatted,index=values.index,name=values.name)
+    return formatted
+
 # %% ../nbs/05_formatting.ipynb 6
-def format_factory(
+def _format_factory(
     string_or_callable:FormatterT,
     null_format:str = '',
     **kwargs
 )->Callable:
-    """
-    Returns a function factory to format a given value. 
-    """
     if callable(string_or_callable):
+        vectorized = _array_formats.get(string_or_callable)
         def _formatter(val,*args):
+            if isinstance(val,(pd.Series,np.ndarray)):
+                if vectorized is not None:
+                    return _format_array(val,lambda v: vectorized(v,*args,**kwargs),null_format)
+                return _format_array(val,lambda v: [string_or_callable(x,*args,**kwargs) for x in v],null_format)
 
-            if val=='' or isnull(val):
+            if _is_null(val):
                 return null_format
             return string_or_callable(val,*args,**kwargs)
         
         return _formatter
     
+    format_value = _compile_format(string_or_callable)
     def _formatter(val):
-        if val=='' or isnull(val):
+        if isinstance(val,(pd.Series,np.ndarray)):
+            return _format_array(val,lambda v: list(map(format_value,v)),null_format)
+        if _is_null(val):
             return null_format
 
-        return string_or_callable.format(val)
+        return format_value(val)
     return _formatter
 
-# %% ../nbs/05_formatting.ipynb 10
+@lru_cache(maxsize=1024)
+def _cached_format_factory(string_or_callable,null_format,kwargs:tuple)->Callable:
+    return _format_factory(string_or_callable,null_format,**dict(kwargs))
+
+def format_factory(
+    string_or_callable:FormatterT,
+    null_format:str = '',
+    **kwargs
+)->Callable:
+    """
+    Returns a function factory to format a given value. 
+    
+    The function also formats a whole Series or array at once, finding nulls once rather than for every value. 
+    Functions are cached, so asking for the same format again is cheap.
+    """
+    key = tuple(sorted(kwargs.items()))
+    try:
+        hash((string_or_callable,null_format,key))
+    except TypeError:
+        # e.g. a list passed as a keyword argument
+        return _format_factory(string_or_callable,null_format,**kwargs)
+    return _cached_format_factory(string_or_callable,null_format,key)
+
+# %% ../nbs/05_formatting.ipynb 12
 def big_number(num:float,decimal_places:int=2)->str:
     magnitude = 0
     while abs(num) >= 1000:
@@ -57,19 +130,19 @@ def big_number(num:float,decimal_places:int=2)->str:
     formatted = f'%.{decimal_places}f%s' % (num, ['', 'K', 'M', 'B', 'T', 'P'][magnitude])
     return formatted
 
-# %% ../nbs/05_formatting.ipynb 11
+# %% ../nbs/05_formatting.ipynb 13
 def big_dollars(num:float,decimal_places:int=2)->str:
     formatted = big_number(num,decimal_places)
     return f"${formatted}"
 
-# %% ../nbs/05_formatting.ipynb 12
+# %% ../nbs/05_formatting.ipynb 14
 def as_multiple(num:float)->str:
     if abs(num) < 0.005:
         return '-'
     else:
         return '{:.2f}x'.format(num)
 
-# %% ../nbs/05_formatting.ipynb 14
+# %% ../nbs/05_formatting.ipynb 16
 def format_minutes(time:float)->str:
     """Takes in minutes as a float and converts to MM:SS"""
     if type(time)==dt.time:
@@ -78,13 +151,56 @@ def format_minutes(time:float)->str:
     seconds = (time * 60) % 60
     return "%02d:%02d" % (minutes, seconds)
 
-# %% ../nbs/05_formatting.ipynb 16
+# %% ../nbs/05_formatting.ipynb 17
+# magnitudes and masks are computed with numpy. Strings are built with `map` over lists of floats, which is faster than `np.char`
+
+def _big_numbers(nums:np.ndarray,decimal_places:int=2)->list:
+    nums = nums.astype(float)
+    suffixes = np.array(['', 'K', 'M', 'B', 'T', 'P'],dtype=object)
+    magnitude = np.zeros(len(nums),dtype=int)
+    # divide the same way as `big_number`, so results are identical
+    for _ in range(len(suffixes)):
+        large = np.abs(nums)>=1000
+        if not large.any():
+            break
+        magnitude[large] += 1
+        nums[large] /= 1000.0
+    # an IndexError past the last suffix, like `big_number`
+    return list(map(f'%.{decimal_places}f%s'.__mod__,zip(nums.tolist(),suffixes[magnitude].tolist())))
+
+def _big_dollars(nums:np.ndarray,decimal_places:int=2)->list:
+    return ['$'+num for num in _big_numbers(nums,decimal_places)]
+
+def _as_multiples(nums:np.ndarray)->list:
+    nums = nums.astype(float)
+    small = (np.abs(nums)<0.005).tolist()
+    format_multiple = '{:.2f}x'.format
+    return ['-' if is_small else format_multiple(num) for num,is_small in zip(nums.tolist(),small)]
+
+def _format_minutes(times:np.ndarray)->list:
+    if any(type(time)==dt.time for time in times):
+        return [format_minutes(time) for time in times]
+    times = times.astype(float)
+    minutes = np.floor(times)
+    seconds = (times * 60) % 60
+    return list(map('%02d:%02d'.__mod__,zip(minutes.tolist(),seconds.tolist())))
+
+_array_formats.update({
+    big_number:_big_numbers,
+    big_dollars:_big_dollars,
+    as_multiple:_as_multiples,
+    format_minutes:_format_minutes
+})
+
+# %% ../nbs/05_formatting.ipynb 19
 class Formatter():
     """
     A customizable object for applying string formats. 
     
     Any additional attributes passed during instantion must have a name ending in "_format". 
     Values can be either a formattable string (e.g. "{:.0f}") or a callable.  
+    
+    Methods format a single value, or a whole Series or array at once.
     """
     def __init__(
         self,
@@ -100,41 +216,86 @@ class Formatter():
         minutes_format: FormatterT = format_minutes,
         **kwargs
     ):
-        self.null_format = null_format
-        self.dollars_format=dollars_format
-        self.percent_format=percent_format
-        self.percent2dp_format=percent2dp_format
-        self.number_format=number_format
-        self.small_number_format=small_number_format
-        self.big_number_format=big_number_format
-        self.big_dollars_format=big_dollars_format
-        self.multiple_format = multiple_format
-        self.minutes_format = minutes_format
-        
+        formats = {
+            'dollars':dollars_format,
+            'percent':percent_format,
+            'percent2dp':percent2dp_format,
+            'number':number_format,
+            'small_number':small_number_format,
+            'big_number':big_number_format,
+            'big_dollars':big_dollars_format,
+            'multiple':multiple_format,
+            'minutes':minutes_format
+        }
         #add anything extra
         for k,v in kwargs.items():
             if not k.split('_')[-1]=='format':
                 raise ValueError(f"Keyword arguments passed to the Formatter must end in '_format' ")
-            setattr(self,k,v)
-        
+            formats[k[:-len('_format')]] = v
+
+        self.null_format = null_format
         # create methods from string_formats
-        items = [(k,v) for k,v in self.__dict__.items()]
-        for k,v in items:
-            if not k.startswith('null'):
-                method = '_'.join([x for x in k.split('_')][:-1]) # remove "_format" from the end of the attribute when setting the method
-                if type(v)==tuple:
-                    setattr(
-                        self,
-                        method,
-                        format_factory(
-                            v[0],
-                            null_format = self.null_format,
-                            **v[1]
-                        )
-                    )
-                else:
-                    setattr(
-                        self,
-                        method,
-                        format_factory(v,null_format=self.null_format)
-                    )
+        for method,v in formats.items():
+            setattr(self,f'{method}_format',v)
+            if method.startswith('null'):
+                continue
+            if type(v)==tuple:
+                setattr(self,method,format_factory(v[0],null_format=self.null_format,**v[1]))
+            else:
+                setattr(self,method,format_factory(v,null_format=self.null_format))
+
+    def format_frame(
+        self,
+        df:pd.DataFrame,
+        formats:Dict[str,FormatterT] # {column: the name of a format (e.g. 'dollars'), a format string or a callable}
+    )->pd.DataFrame:
+        "A copy of `df` with `formats` applied to its columns"
+        formatted = df.copy()
+        for column,format in formats.items():
+            method = getattr(self,format,None) if isinstance(format,str) else None
+            if not callable(method):
+                method = format_factory(format,null_format=self.null_format)
+            formatted[column] = method(df[column])
+        return formatted
+
+    def to_html(
+        self,
+        df:pd.DataFrame,
+        column_formats:Optional[Dict[str,FormatterT]]=None, # as in `format_frame`. Other columns are converted with `str`
+        max_rows:Optional[int]=None, # rows per page, or the rows to show before truncating
+        page:int=0, # the page to show if `max_rows` is set
+        index:bool=False,
+        table_attributes:str='class="dataframe"'
+    )->str:
+        """An HTML table of `df` with `column_formats` applied. 
+        
+        Only the rows shown are formatted, a column at a time, and the HTML is built in one join, which is much faster than `DataFrame.style`."""
+        n_rows = len(df)
+        if max_rows is not None:
+            # an empty frame still has one (empty) page
+            pages = max(1,-(-n_rows//max_rows))
+            if not 0<=page<pages:
+                raise ValueError(f"page must be from 0 to {pages-1} for {n_rows} rows of {max_rows} per page, not {page}")
+            df = df.iloc[page*max_rows:(page+1)*max_rows]
+        formats = {column:'{}' for column in df.columns}
+        formats.update(column_formats or {})
+        formatted = self.format_frame(df,formats)
+        columns = [list(map(html.escape,formatted[column].astype(str).tolist())) for column in formatted.columns]
+        header = [html.escape(str(column)) for column in df.columns]
+        if index:
+            columns.insert(0,list(map(html.escape,map(str,df.index))))
+            header.insert(0,html.escape(str(df.index.name or '')))
+        cell = '</td><td>'
+        rows = [f'<tr><td>{cell.join(row)}</td></tr>' for row in zip(*columns)]
+        if max_rows is not None and len(df)<n_rows:
+            first = page*max_rows
+            rows.append(
+                f'<tr><td colspan="{len(header)}">rows {first+1 if len(df) else first}-{first+len(df)} of {n_rows}</td></tr>'
+            )
+        return ''.join([
+            f'<table {table_attributes}><thead><tr><th>',
+            '</th><th>'.join(header),
+            '</th></tr></thead><tbody>',
+            *rows,
+            '</tbody></table>'
+        ])
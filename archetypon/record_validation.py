@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_record_validation.ipynb.
 
 # %% auto 0
-__all__ = ['record_model']
+__all__ = ['errors_to_frame', 'record_model']
 
 # %% ../nbs/03_record_validation.ipynb 2
 import pandas as pd
@@ -10,51 +10,502 @@ from typing import *
 from archetypon.base_model import BaseModel,GenericModel,DataFrame
 from pydantic import parse_obj_as,ValidationError,validator
 from pydantic.utils import update_not_none
+from pydantic import Extra
+from pydantic.error_wrappers import ErrorWrapper,flatten_errors
+from concurrent.futures import ProcessPoolExecutor
+import os
+import weakref
+from pydantic.fields import ModelField,SHAPE_SINGLETON
+from pydantic.types import ConstrainedInt,ConstrainedFloat,ConstrainedStr
+from pydantic.typing import is_literal_type,all_literal_values
+from pydantic.validators import BOOL_TRUE,BOOL_FALSE
+from pydantic.datetime_parse import date_re,datetime_re
+from enum import Enum
+import numpy as np
+import datetime as dt
+import sys
 
 # %% ../nbs/03_record_validation.ipynb 3
-def parse_dataframe_rows_as(
+class _RowError(ErrorWrapper):
+    "An `ErrorWrapper` for a row, which also keeps the row's position, since index labels can be repeated"
+    __slots__ = ('position',)
+    
+    def __init__(self,exc:Exception,index,position:int):
+        # a tuple `loc` is read as a path, so a MultiIndex label is wrapped to stay in one piece
+        super().__init__(exc,loc=(index,))
+        self.position = position
+
+def _row_errors(e:ValidationError,index,position:int)->List[ErrorWrapper]:
+    "Errors raised by `parse_obj_as` for a row, located by the row's index instead of pydantic's `__root__`."
+    return [_RowError(error.exc,index,position) for error in e.raw_errors]
+
+def _parse_chunk(parse:Callable,model:Type[BaseModel],chunk:PandasDataFrame,max_errors:Optional[int],offset:int):
+    "Runs in a worker process."
+    try:
+        return parse(model,chunk,max_errors,offset)
+    except ValidationError as e:
+        # too many errors
+        return None, e.raw_errors
+
+def _parse_in_parallel(
+    parse:Callable, # `_parse_rows` or `_parse_columns`
     model:Type[BaseModel],
-    df:PandasDataFrame
-)->PandasDataFrame:
-    """Uses .parse_obj() method of Pydantic's `BaseModel` to validate rows of a dataframe."""
+    df:PandasDataFrame,
+    n_jobs:int,
+    chunk_size:Optional[int]=None,
+    max_errors:Optional[int]=None
+)->Tuple[PandasDataFrame,List[ErrorWrapper]]:
+    "Splits `df` into chunks of rows and validates them in a pool of `n_jobs` processes."
+    n_jobs = os.cpu_count() if n_jobs==-1 else n_jobs
+    chunk_size = chunk_size or -(-len(df)//(n_jobs*4))
+    chunks = ((i,df.iloc[i:i+chunk_size]) for i in range(0,len(df),chunk_size))
     
-    # convert dataframe to a series of dictionaries
+    validated, errors = [], []
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        futures = [pool.submit(_parse_chunk,parse,model,chunk,max_errors,offset) for offset,chunk in chunks]
+        for future in futures:
+            chunk,chunk_errors = future.result()
+            validated.append(chunk)
+            errors.extend(chunk_errors)
+            if max_errors and len(errors)>=max_errors:
+                # chunks that haven't started are dropped, and leaving the pool only waits for the running ones.
+                # (`shutdown(cancel_futures=True)` does the same, but needs python 3.9)
+                for pending in futures:
+                    pending.cancel()
+                raise ValidationError(errors=errors[:max_errors],model=model)
+    # chunks where every row failed have no dtypes to contribute
+    return pd.concat([chunk for chunk in validated if len(chunk)>0] or validated), errors
+
+def _rows_without_nulls(df:PandasDataFrame)->List[dict]:
+    """The rows of `df` as dictionaries, leaving out null cells (NaN, None, `pd.NA` and `NaT`). 
+    
+    The null mask is computed once for the whole frame, rather than calling `.dropna()` on every row."""
+    columns = df.columns.tolist()
+    if not columns:
+        return [{} for _ in range(len(df))]
+    # converted a column at a time: `df.to_numpy(dtype=object)` turns frames of only datetimes into integer nanoseconds
+    values = [df.iloc[:,n].to_numpy(dtype=object) for n in range(len(columns))]
+    return [
+        {column:value for column,value,notnull in zip(columns,row,row_notnull) if notnull}
+        for row,row_notnull in zip(zip(*values),df.notna().to_numpy())
+    ]
+
+def _models_to_frame(model:Type[BaseModel],series_of_models:pd.Series)->PandasDataFrame:
+    if len(series_of_models)==0:
+        return PandasDataFrame(columns=list(model.__fields__),index=series_of_models.index)
+    # from model back to dictionaries and then back to Series
+    return series_of_models.apply(
+        lambda x: x.dict(),
+    ).apply(pd.Series)
+
+def _parse_rows(
+    model:Type[BaseModel],
+    df:PandasDataFrame,
+    max_errors:Optional[int]=None,
+    offset:int=0 # position of `df`'s first row, when it's a chunk of a larger frame
+)->Tuple[PandasDataFrame,List[ErrorWrapper]]:
+    "Validates each row with `parse_obj_as`. Returns the valid rows and the errors of the others."
+    # convert dataframe to a list of dictionaries
     # drop NaN values because pydantic doesn't consider them to be 'None', and that interferes with validation
-    series_of_dicts = df.apply(
-        lambda row: row.dropna().to_dict(),
-        axis=1
-    )
+    rows = _rows_without_nulls(df)
     
     #convert the series of dicts to a series of parsed models
     errors = []
-    def parse_row(row):
+    def parse_row(index,position,row):
         try:
             validated = parse_obj_as(model,row)
             return validated
         except ValidationError as e:
-            raw_errors = e.raw_errors
-            
-            errors.extend(raw_errors)
-            
-            return BaseModel()
-        return validated
+            errors.extend(_row_errors(e,index,position))
+            if max_errors and len(errors)>=max_errors:
+                raise ValidationError(errors=errors,model=model)
+            return None
     
-    series_of_models = series_of_dicts.apply(
-        lambda x: parse_row(x),
+    series_of_models = pd.Series(
+        [parse_row(index,offset+position,row) for position,(index,row) in enumerate(zip(df.index,rows))],
+        index=df.index,
+        dtype=object
     )
-    if len(errors)>0:
+    return _models_to_frame(model,series_of_models.dropna()), errors
+
+def _handle_errors(
+    model:Type[BaseModel],
+    validated:PandasDataFrame,
+    errors:List[ErrorWrapper],
+    mode:Literal['raise','collect','drop']
+):
+    if mode=='raise' and len(errors)>0:
         raise ValidationError(errors=errors,model=model)
-    # from model back to dictionaries and then back to Series
-    validated = series_of_models.apply(
-        lambda x: x.dict(),
-    ).apply(pd.Series)
-    
+    if mode=='collect':
+        return validated, errors_to_frame(ValidationError(errors=errors,model=model))
     return validated
 
-# %% ../nbs/03_record_validation.ipynb 9
+def _check_options(errors:str,n_jobs:int):
+    "Raises a `ValueError` for options the parsers can't use, before any rows are validated"
+    if errors not in ('raise','collect','drop'):
+        raise ValueError(f"errors must be 'raise', 'collect' or 'drop', not '{errors}'")
+    if n_jobs<1 and n_jobs!=-1:
+        raise ValueError(f"n_jobs must be a positive number of processes or -1 (every core), not {n_jobs!r}")
+
+def parse_dataframe_rows_as(
+    model:Type[BaseModel],
+    df:PandasDataFrame,
+    n_jobs:int=1, # number of processes to validate with. -1 uses every core
+    chunk_size:Optional[int]=None, # rows per process when `n_jobs!=1`
+    errors:Literal['raise','collect','drop']='raise', # what to do with rows that fail validation
+    max_errors:Optional[int]=None # stop validating and raise once this many rows have failed
+)->Union[PandasDataFrame,Tuple[PandasDataFrame,PandasDataFrame]]:
+    """Uses .parse_obj() method of Pydantic's `BaseModel` to validate rows of a dataframe.
+    
+    With `errors='raise'` a `ValidationError` is raised if any row fails. `errors='drop'` returns only the valid rows, 
+    and `errors='collect'` returns the valid rows and a DataFrame of errors (see `errors_to_frame`)."""
+    _check_options(errors,n_jobs)
+    if len(df)==0:
+        validated, row_errors = PandasDataFrame(columns=list(model.__fields__),index=df.index), []
+    elif n_jobs!=1:
+        validated, row_errors = _parse_in_parallel(_parse_rows,model,df,n_jobs,chunk_size,max_errors)
+    else:
+        validated, row_errors = _parse_rows(model,df,max_errors)
+    return _handle_errors(model,validated,row_errors,errors)
+
+
+# %% ../nbs/03_record_validation.ipynb 4
+def errors_to_frame(e:ValidationError)->PandasDataFrame:
+    """A DataFrame with one row per error of a RecordFrame: the index of the row that failed, the column, the error type and the message. 
+    
+    `position` is the row's position in the validated frame, which identifies it even when index labels are repeated."""
+    config = getattr(e.model,'__config__',None)
+    return PandasDataFrame(
+        [
+            {
+                'row':error['loc'][0],
+                'position':getattr(raw_error,'position',None),
+                'column':'.'.join(str(loc) for loc in error['loc'][1:]) or None,
+                'type':error['type'],
+                'message':error['msg']
+            } for raw_error in e.raw_errors for error in flatten_errors([raw_error],config)
+        ],
+        columns=['row','position','column','type','message']
+    )
+
+
+# %% ../nbs/03_record_validation.ipynb 17
+class _CellByCell(Exception):
+    "Raised by a column caster when a column can't be cast as a whole and has to be validated cell by cell."
+
+def _constraint_mask(values:pd.Series, tp:type)->pd.Series:
+    "Vectorized equivalent of pydantic's `number_size_validator` and `number_multiple_validator`."
+    bad = pd.Series(False,index=values.index)
+    if getattr(tp,'gt',None) is not None: bad |= ~(values > tp.gt)
+    if getattr(tp,'ge',None) is not None: bad |= ~(values >= tp.ge)
+    if getattr(tp,'lt',None) is not None: bad |= ~(values < tp.lt)
+    if getattr(tp,'le',None) is not None: bad |= ~(values <= tp.le)
+    if getattr(tp,'multiple_of',None) is not None:
+        mod = values / tp.multiple_of % 1
+        bad |= ~((mod.abs() <= sys.float_info.epsilon) | ((mod.abs()-1).abs() <= sys.float_info.epsilon))
+    return bad
+
+def _cast_int(values, tp, config):
+    strict = getattr(tp,'strict',False)
+    bad = pd.Series(False,index=values.index)
+    if pd.api.types.is_bool_dtype(values):
+        if strict: raise _CellByCell
+        cast = values.astype('int64')
+    elif pd.api.types.is_integer_dtype(values):
+        if pd.api.types.is_unsigned_integer_dtype(values) and (values > np.iinfo('int64').max).any():
+            raise _CellByCell
+        cast = values.astype('int64')
+    elif strict:
+        raise _CellByCell
+    elif pd.api.types.is_float_dtype(values):
+        # pydantic truncates floats with int(), which is what numpy's cast does
+        bad = ~np.isfinite(values) | (values.abs() >= 2**63)
+        cast = values.where(~bad,0).astype('int64')
+    elif pd.api.types.infer_dtype(values,skipna=False)=='string':
+        bad = ~values.str.fullmatch(r'\s*[+-]?\d+\s*')
+        cast = values.where(~bad,'0').str.strip().astype('int64')
+    elif pd.api.types.infer_dtype(values,skipna=False)=='integer':
+        cast = values.astype('int64')
+    else:
+        raise _CellByCell
+    return cast, bad | _constraint_mask(cast,tp)
+
+def _cast_float(values, tp, config):
+    strict = getattr(tp,'strict',False)
+    bad = pd.Series(False,index=values.index)
+    if pd.api.types.is_float_dtype(values):
+        cast = values.astype('float64')
+    elif strict:
+        raise _CellByCell
+    elif pd.api.types.is_numeric_dtype(values) or pd.api.types.infer_dtype(values,skipna=False) in ('integer','floating','mixed-integer-float'):
+        cast = values.astype('float64')
+    elif pd.api.types.infer_dtype(values,skipna=False)=='string':
+        cast = pd.to_numeric(values,errors='coerce').astype('float64')
+        # strings pandas can't read are left to pydantic (e.g. 'nan', '1_0')
+        bad = cast.isna()
+    else:
+        raise _CellByCell
+    allow_inf_nan = getattr(tp,'allow_inf_nan',None)
+    if allow_inf_nan is None: allow_inf_nan = getattr(config,'allow_inf_nan',True)
+    if not allow_inf_nan: bad |= ~np.isfinite(cast)
+    return cast, bad | _constraint_mask(cast,tp)
+
+def _cast_str(values, tp, config):
+    if pd.api.types.infer_dtype(values,skipna=False)=='string':
+        # pandas' StringDtype becomes object, which is what parsing rows gives
+        cast = values.astype(object)
+    elif getattr(tp,'strict',False) or pd.api.types.is_bool_dtype(values):
+        raise _CellByCell
+    elif pd.api.types.is_integer_dtype(values) or pd.api.types.is_float_dtype(values):
+        cast = values.map(str)
+    else:
+        raise _CellByCell
+    # same order as pydantic's ConstrainedStr/anystr validators
+    if getattr(tp,'strip_whitespace',False) or config.anystr_strip_whitespace:
+        cast = cast.str.strip()
+    if getattr(tp,'to_upper',False) or getattr(config,'anystr_upper',False):
+        cast = cast.str.upper()
+    if getattr(tp,'to_lower',False) or config.anystr_lower:
+        cast = cast.str.lower()
+    min_length = getattr(tp,'min_length',None)
+    max_length = getattr(tp,'max_length',None)
+    min_length = config.min_anystr_length if min_length is None else min_length
+    max_length = config.max_anystr_length if max_length is None else max_length
+    bad = pd.Series(False,index=values.index)
+    if min_length is not None or max_length is not None:
+        lengths = cast.str.len()
+        if min_length is not None: bad |= lengths < min_length
+        if max_length is not None: bad |= lengths > max_length
+    if getattr(tp,'curtail_length',None):
+        cast = cast.str[:tp.curtail_length]
+    if getattr(tp,'regex',None) is not None:
+        bad |= ~cast.str.match(tp.regex)
+    return cast, bad
+
+def _cast_datetime(values, tp, config):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values, pd.Series(False,index=values.index)
+    inferred = pd.api.types.infer_dtype(values,skipna=False)
+    if inferred=='datetime':
+        cast = pd.to_datetime(values)
+        if not pd.api.types.is_datetime64_any_dtype(cast): raise _CellByCell
+        return cast, pd.Series(False,index=values.index)
+    if inferred=='string':
+        parts = values.str.extract(datetime_re)
+        # pydantic and pandas disagree about timezones and sub-microsecond digits, so leave those to pydantic
+        if parts['tzinfo'].notna().any(): raise _CellByCell
+        cast = pd.to_datetime(values.where(parts['year'].notna()),format='ISO8601',errors='coerce')
+        return cast, cast.isna() | (cast.dt.nanosecond!=0)
+    raise _CellByCell
+
+def _cast_date(values, tp, config):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.date, pd.Series(False,index=values.index)
+    inferred = pd.api.types.infer_dtype(values,skipna=False)
+    if inferred in ('date','datetime') and all(isinstance(v,dt.date) for v in values):
+        cast = pd.Series([v.date() if isinstance(v,dt.datetime) else v for v in values],index=values.index,dtype=object)
+        return cast, pd.Series(False,index=values.index)
+    if inferred=='string':
+        parsed = pd.to_datetime(values.where(values.str.match(date_re)),format='%Y-%m-%d',errors='coerce')
+        return parsed.dt.date, parsed.isna()
+    raise _CellByCell
+
+def _cast_lookup(choices:dict,normalize:Callable=lambda v: v):
+    "Caster for fields that accept a fixed set of values (enums, literals and booleans). Mirrors pydantic's dict lookups exactly."
+    missing = object()
+    def _lookup(v):
+        try:
+            return choices.get(normalize(v),missing)
+        except TypeError:
+            return missing
+    def _cast(values, tp, config):
+        cast = pd.Series([_lookup(v) for v in values],index=values.index,dtype=object)
+        bad = cast.map(lambda v: v is missing).astype(bool)
+        return cast.where(~bad,None), bad
+    return _cast
+
+def _column_caster(field:ModelField, config)->Optional[Callable]:
+    "Returns a vectorized caster for `field`, or None if the field has to be validated cell by cell."
+    if field.shape!=SHAPE_SINGLETON or field.sub_fields or field.class_validators:
+        return None
+    tp = field.type_
+    if is_literal_type(tp):
+        return _cast_lookup({v:v for v in all_literal_values(tp)})
+    if not isinstance(tp,type):
+        return None
+    if issubclass(tp,Enum):
+        members = {m.value:m for m in tp}
+        members.update({m:m for m in tp})
+        if config.use_enum_values: members = {k:m.value for k,m in members.items()}
+        return _cast_lookup(members)
+    if tp is bool:
+        return _cast_lookup(
+            {**{v:True for v in BOOL_TRUE},**{v:False for v in BOOL_FALSE},True:True,False:False},
+            normalize=lambda v: v.lower() if isinstance(v,str) else v
+        )
+    if tp is int or issubclass(tp,ConstrainedInt): return _cast_int
+    if tp is float or issubclass(tp,ConstrainedFloat): return _cast_float
+    if tp is str or issubclass(tp,ConstrainedStr): return _cast_str
+    if tp is dt.datetime: return _cast_datetime
+    if tp is dt.date: return _cast_date
+    return None
+
+
+class _RowModelPlan:
+    "What column-wise validation needs to know about a row model, worked out once per model. Doesn't reference the model, so it can be cached by weak reference."
+    def __init__(self,model:Type[BaseModel]):
+        config = model.__config__
+        self.fields = list(model.__fields__)
+        self.aliases = {name:field.alias for name,field in model.__fields__.items()}
+        # column names a row can be read from
+        self.columns = set(self.aliases.values()) | (set(self.fields) if config.allow_population_by_field_name else set())
+        self.casters = {name:_column_caster(field,config) for name,field in model.__fields__.items()}
+        self.forbid_extra = config.extra==Extra.forbid
+        # root validators see whole rows and extra columns end up in the rows, so these models can't be split into columns
+        self.by_columns = not (
+            model.__pre_root_validators__ or model.__post_root_validators__ or model.__custom_root_type__
+            or config.extra==Extra.allow
+        )
+
+_row_model_plans = weakref.WeakKeyDictionary()
+
+def _row_model_plan(model:Type[BaseModel])->_RowModelPlan:
+    try:
+        return _row_model_plans[model]
+    except KeyError:
+        plan = _row_model_plans[model] = _RowModelPlan(model)
+        return plan
+
+
+# %% ../nbs/03_record_validation.ipynb 18
+def _validate_cells(
+    model:Type[BaseModel],
+    field:ModelField,
+    values:pd.Series,
+    columns:Dict[str,pd.Series]
+):
+    "Validates `values` one cell at a time with the field's own validators. `columns` holds the fields validated so far."
+    prior = {name:column.tolist() for name,column in columns.items()} if field.class_validators else {}
+    cast, bad = [], []
+    for i,v in values.items():
+        value, errors = field.validate(v,{name:column[i] for name,column in prior.items()},loc=field.alias,cls=model)
+        cast.append(value)
+        bad.append(errors is not None)
+    return pd.Series(cast,index=values.index,dtype=object), pd.Series(bad,index=values.index,dtype=bool)
+
+def _column_values(df:PandasDataFrame, field:ModelField, config)->Optional[pd.Series]:
+    "The column holding `field` (by alias, or by name if the model allows it), positionally indexed."
+    values = None
+    if field.alias in df.columns:
+        values = pd.Series(df[field.alias].array)
+    if config.allow_population_by_field_name and field.alt_alias and field.name in df.columns:
+        by_name = pd.Series(df[field.name].array)
+        values = by_name if values is None else values.where(values.notna(),by_name)
+    return values
+
+def _parse_columns(
+    model:Type[BaseModel],
+    df:PandasDataFrame,
+    max_errors:Optional[int]=None,
+    offset:int=0 # position of `df`'s first row, when it's a chunk of a larger frame
+)->Tuple[PandasDataFrame,List[ErrorWrapper]]:
+    "Validates `df` a column at a time. Returns the valid rows and the errors of the others."
+    config = model.__config__
+    plan = _row_model_plan(model)
+    if (
+        not df.columns.is_unique or not plan.by_columns
+        or (plan.forbid_extra and not set(df.columns) <= plan.columns)
+    ):
+        # no safe way of splitting the model into columns
+        return _parse_rows(model,df,max_errors,offset)
+    
+    flagged = pd.Series(False,index=pd.RangeIndex(len(df)))
+    columns = {}
+    for name,field in model.__fields__.items():
+        values = _column_values(df,field,config)
+        present = values.notna() if values is not None else pd.Series(False,index=flagged.index)
+        column = pd.Series(None,index=flagged.index,dtype=object)
+        
+        if present.any():
+            caster = plan.casters[name]
+            # rows that are already flagged get re-parsed anyway
+            to_cast = values[present & ~flagged]
+            try:
+                if caster is None: raise _CellByCell
+                cast, bad = caster(to_cast,field.type_,config)
+            except (_CellByCell,ValueError,TypeError,OverflowError):
+                cast, bad = _validate_cells(model,field,to_cast,columns)
+            flagged |= bad.reindex(flagged.index,fill_value=False)
+            if len(cast)==len(column) and not bad.any():
+                column = cast
+            else:
+                column[cast.index] = cast
+        
+        if not present.all():
+            # missing values get the default, unless pydantic would raise or validate it
+            missing = ~present
+            if field.required or field.validate_always:
+                flagged |= missing
+            elif field.default_factory or isinstance(field.default,(list,dict,set)):
+                column[missing] = pd.Series([field.get_default() for _ in range(missing.sum())],index=missing[missing].index,dtype=object)
+            else:
+                column[missing] = field.get_default()
+        columns[name] = column
+    
+    errors = []
+    valid = np.ones(len(df),dtype=bool)
+    if flagged.any():
+        columns = {name:column.to_numpy(dtype=object) for name,column in columns.items()}
+        positions = flagged[flagged].index
+        for i,row in zip(positions,_rows_without_nulls(df.iloc[positions])):
+            try:
+                row = parse_obj_as(model,row)
+                for name,value in row.dict().items():
+                    columns[name][i] = value
+            except ValidationError as e:
+                errors.extend(_row_errors(e,df.index[i],offset+i))
+                valid[i] = False
+                if max_errors and len(errors)>=max_errors:
+                    raise ValidationError(errors=errors,model=model)
+    
+    validated = pd.DataFrame(columns,copy=False)
+    validated.index = df.index
+    if not valid.all():
+        validated = validated[valid]
+    return validated.infer_objects(), errors
+
+def parse_dataframe_columns_as(
+    model:Type[BaseModel],
+    df:PandasDataFrame,
+    n_jobs:int=1, # number of processes to validate with. -1 uses every core
+    chunk_size:Optional[int]=None, # rows per process when `n_jobs!=1`
+    errors:Literal['raise','collect','drop']='raise', # what to do with rows that fail validation
+    max_errors:Optional[int]=None # stop validating and raise once this many rows have failed
+)->Union[PandasDataFrame,Tuple[PandasDataFrame,PandasDataFrame]]:
+    """Column-wise equivalent of `parse_dataframe_rows_as`. 
+    
+    Fields are cast a column at a time with vectorized pandas operations. Fields with custom validators, or with types that can't be cast as a column, 
+    are validated cell by cell with the field's own pydantic validators. Rows that fail any check are re-parsed with `parse_obj_as`, 
+    so the validated values and any `ValidationError` are the same as `parse_dataframe_rows_as`. Dtypes can differ (see below).
+    """
+    _check_options(errors,n_jobs)
+    if len(df)==0:
+        validated, row_errors = PandasDataFrame(columns=list(model.__fields__),index=df.index), []
+    elif n_jobs!=1:
+        validated, row_errors = _parse_in_parallel(_parse_columns,model,df,n_jobs,chunk_size,max_errors)
+    else:
+        validated, row_errors = _parse_columns(model,df,max_errors)
+    return _handle_errors(model,validated,row_errors,errors)
+
+# %% ../nbs/03_record_validation.ipynb 24
 class TypedRecordFrame(DataFrame):
     row_model: Optional[Type[BaseModel]] = None
     alias_as_column_names: bool = False
+    validation_mode: Literal['rows','columns'] = 'rows'
+    n_jobs: int = 1
+    chunk_size: Optional[int] = None
+    errors: Literal['raise','collect','drop'] = 'raise'
+    max_errors: Optional[int] = None
         
     @classmethod
     def __get_validators__(cls):
@@ -77,7 +528,19 @@ class TypedRecordFrame(DataFrame):
     def validate_rows(cls, df):
         
         if cls.row_model:
-            validated = parse_dataframe_rows_as(cls.row_model,df)
+            parse = parse_dataframe_columns_as if cls.validation_mode=='columns' else parse_dataframe_rows_as
+            validated = parse(
+                cls.row_model,
+                df,
+                n_jobs=cls.n_jobs,
+                chunk_size=cls.chunk_size,
+                errors=cls.errors,
+                max_errors=cls.max_errors
+            )
+            if cls.errors=='collect':
+                validated, validation_errors = validated
+                # kept in `attrs` rather than on a RecordFrame instance, so validated frames stay plain (picklable) DataFrames
+                validated.attrs['validation_errors'] = validation_errors
                             
             return validated
         return df
@@ -86,25 +549,82 @@ class TypedRecordFrame(DataFrame):
     def validate_column_names(cls,df):
         if cls.alias_as_column_names==True:
             # create a dictionary mapping field names to aliases
-            field_name_to_alias = {
-                field_name: cls.row_model.__fields__[field_name].alias
-                for field_name in cls.row_model.__fields__
-            }
+            field_name_to_alias = _row_model_plan(cls.row_model).aliases
 
             df.rename(columns=field_name_to_alias,inplace=True)
         return df
+    
+    @classmethod
+    def validate(cls,df)->PandasDataFrame:
+        "Runs the RecordFrame's validators on `df` outside of a pydantic model."
+        for validator in cls.__get_validators__():
+            df = validator(df)
+        return df
+    
+    @classmethod
+    def validate_iter(cls,chunks:Iterable[PandasDataFrame])->Iterator[PandasDataFrame]:
+        """Validates DataFrames one at a time (e.g. from `pd.read_csv(chunksize=...)`), yielding each validated chunk. 
+        
+        Chunks that fail aren't yielded. Their errors are collected and raised as a single `ValidationError` once `chunks` is exhausted. 
+        With `errors='collect'`, each yielded chunk's `attrs['validation_errors']` holds the errors of every chunk so far, 
+        so the last chunk's are those of a single `validate_rows` call on the whole stream. 
+        Either way, error positions count rows from the start of the stream."""
+        errors, collected = [], []
+        consumed = 0
+        for chunk in chunks:
+            try:
+                validated = cls.validate(chunk)
+            except ValidationError as e:
+                for error in e.raw_errors:
+                    if getattr(error,'position',None) is not None:
+                        error.position += consumed
+                errors.extend(e.raw_errors)
+                if cls.max_errors and len(errors)>=cls.max_errors:
+                    break
+                continue
+            finally:
+                consumed += len(chunk)
+            if 'validation_errors' in validated.attrs:
+                chunk_errors = validated.attrs['validation_errors']
+                # empty frames of errors are left out, so they don't turn the columns' dtypes into object
+                if len(chunk_errors)>0:
+                    collected.append(chunk_errors.assign(position=chunk_errors['position']+consumed-len(chunk)))
+                if collected:
+                    validated.attrs['validation_errors'] = pd.concat(collected,ignore_index=True)
+            yield validated
+        if len(errors)>0:
+            raise ValidationError(errors=errors,model=cls.row_model)
             
 
-# %% ../nbs/03_record_validation.ipynb 10
+# %% ../nbs/03_record_validation.ipynb 25
 class RecordModelFrameMeta(type):
     def __getitem__(self, constraint):
-        return type('RecordFrame', (TypedRecordFrame,), {'row_model': constraint})
+        # the generated class is cached on the row model itself (not in a registry), so the two are garbage collected together
+        record_frame = getattr(constraint,'__dict__',{}).get('__record_frame__')
+        if record_frame is None:
+            record_frame = type('RecordFrame', (TypedRecordFrame,), {'row_model': constraint})
+            if hasattr(constraint,'__fields__'):
+                _row_model_plan(constraint)
+            try:
+                setattr(constraint,'__record_frame__',record_frame)
+            except (AttributeError,TypeError):
+                pass
+        return record_frame
 
-# %% ../nbs/03_record_validation.ipynb 11
+# %% ../nbs/03_record_validation.ipynb 26
 class RecordFrame(DataFrame, metaclass=RecordModelFrameMeta):
     pass
 
-# %% ../nbs/03_record_validation.ipynb 12
-def record_model(kls):
-    """Decorator to make a pydantic model into a RecordFrame, i.e. a DataFrame validated by row."""
+# %% ../nbs/03_record_validation.ipynb 27
+def record_model(kls=None,**options):
+    """Decorator to make a pydantic model into a RecordFrame, i.e. a DataFrame validated by row.
+    
+    Keyword arguments set validation options of the RecordFrame, e.g. `@record_model(validation_mode='columns',n_jobs=4)`"""
+    if kls is None:
+        return lambda kls: record_model(kls,**options)
+    for k in options:
+        if k not in ('alias_as_column_names','validation_mode','n_jobs','chunk_size','errors','max_errors'):
+            raise ValueError(f"'{k}' is not a RecordFrame option")
+    if options:
+        return type('RecordFrame', (RecordFrame[kls],), options)
     return RecordFrame[kls]
@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_string_templating.ipynb.
 
 # %% auto 0
-__all__ = ['get_formatters_from_string', 'string_to_dict', 'StringTemplate']
+__all__ = ['get_formatters_from_string', 'string_to_dict', 'StringTemplate', 'TemplateIndex']
 
 # %% ../nbs/06_string_templating.ipynb 2
 from archetypon.base_model import BaseModel
@@ -9,6 +9,17 @@ from pydantic import root_validator,validator
 from typing import *
 import string
 import re
+from functools import lru_cache
+import pandas as pd
+from pydantic import create_model
+from archetypon.record_validation import parse_dataframe_columns_as
+from pydantic import parse_obj_as
+from pandas.api.types import union_categoricals
+import numpy as np
+import os
+import datetime as dt
+from enum import Enum
+from pydantic.typing import is_literal_type,all_literal_values
 
 # %% ../nbs/06_string_templating.ipynb 3
 def get_formatters_from_string(input_string:str)->List[str]:
@@ -20,14 +31,82 @@ def get_formatters_from_string(input_string:str)->List[str]:
             return {}
 
 # %% ../nbs/06_string_templating.ipynb 5
-def string_to_dict(string, pattern):
-    regex = re.sub(r'{(.+?)}', r'(?P<_\1>.+)', pattern)
-    values = list(re.search(regex, string).groups())
+@lru_cache(maxsize=None)
+def _template_regex(pattern:str)->Tuple[Pattern,List[str]]:
+    "`pattern` compiled to a regex with a group for each field, and the names of the fields"
+    regex = re.compile(re.sub(r'{(.+?)}', r'(?P<_\1>.+)', pattern))
     keys = re.findall(r'{(.+?)}', pattern)
+    return regex, keys
+
+def string_to_dict(string, pattern):
+    regex, keys = _template_regex(pattern)
+    values = list(regex.search(string).groups())
     _dict = dict(zip(keys, values))
     return _dict
 
-# %% ../nbs/06_string_templating.ipynb 7
+# %% ../nbs/06_string_templating.ipynb 6
+_strftime_patterns = {
+    '%Y':r'\d{4}','%y':r'\d{2}','%m':r'\d{2}','%d':r'\d{2}','%H':r'\d{2}',
+    '%M':r'\d{2}','%S':r'\d{2}','%j':r'\d{3}','%f':r'\d{6}','%%':'%'
+}
+
+def _strftime_regex(spec:str)->str:
+    "A regex for dates formatted with `spec`"
+    return ''.join(
+        _strftime_patterns.get(part,r'\w+?' if part.startswith('%') else re.escape(part))
+        for part in re.findall(r'%.|[^%]+',spec)
+    )
+
+def _separator(literal:str)->Optional[str]:
+    "The character a template literal (which is a regex) starts with, if it's a plain character"
+    if literal[:1]=='\\':
+        return literal[1] if len(literal)>1 and not literal[1].isalnum() else None
+    return literal[0] if literal and literal[0] not in '.^$*+?()[]{}|' else None
+
+def _field_regex(field,spec:str,separator:Optional[str])->str:
+    "A regex for the values of a field, from its type and format spec"
+    tp = field.outer_type_ if field is not None else None
+    if tp is not None and is_literal_type(tp):
+        return '(?:'+'|'.join(re.escape(str(v)) for v in all_literal_values(tp))+')'
+    if isinstance(tp,type):
+        if issubclass(tp,Enum):
+            return '(?:'+'|'.join(re.escape(str(member.value)) for member in tp)+')'
+        if issubclass(tp,int) and not issubclass(tp,bool):
+            width = re.fullmatch(r'0?(\d+)d?',spec)
+            return rf'[+-]?\d{{{width.group(1)},}}' if width else r'[+-]?\d+'
+        if issubclass(tp,float):
+            return r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+        if issubclass(tp,dt.date):
+            if spec:
+                return _strftime_regex(spec)
+            if issubclass(tp,dt.datetime):
+                return r'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?'
+            return r'\d{4}-\d{2}-\d{2}'
+        # only a path separator is excluded, since other characters (e.g. '_' or '.') can be part of a name
+        if issubclass(tp,str) and separator=='/':
+            return '[^/]+'
+    return '.+?'
+
+def _typed_template_regex(model,template:str)->Tuple[Pattern,List[str],Dict[str,str]]:
+    """`template` compiled to a regex anchored at both ends, with a group for each field that only matches values of the field's type. 
+    
+    Returns the regex, the names of the fields, and the strftime formats of date fields with format specs."""
+    parts = list(string.Formatter().parse(template))
+    regex, keys, date_formats = '', [], {}
+    for i,(literal,key,spec,_) in enumerate(parts):
+        # literals are regex, but `Formatter` has unescaped any braces
+        regex += literal.replace('{',r'\{').replace('}',r'\}')
+        if key is None:
+            continue
+        field = model.__fields__.get(key)
+        following = parts[i+1][0] if i+1<len(parts) else ''
+        regex += f'(?P<_{key}>{_field_regex(field,spec or "",_separator(following))})'
+        keys.append(key)
+        if spec and field is not None and isinstance(field.outer_type_,type) and issubclass(field.outer_type_,dt.date):
+            date_formats[key] = spec
+    return re.compile(rf'\A(?:{regex})\Z'), keys, date_formats
+
+# %% ../nbs/06_string_templating.ipynb 8
 class StringTemplate(BaseModel):
     """String Template Model. 
     
@@ -35,15 +114,65 @@ class StringTemplate(BaseModel):
     or accept the attributes and create the string. 
     
     Useful for path operations and partitions. 
+    
+    Each field only matches values of its type (e.g. `\\d+` for ints), and str fields followed by a `/` don't match one, 
+    so paths parse a segment at a time instead of backtracking. Date fields can have a format spec, e.g. `{day:%Y%m%d}`.
     """
     string: Optional[str]=None
     template: str
+
+    def __init_subclass__(cls,**kwargs):
+        super().__init_subclass__(**kwargs)
+        # compile the template once per class, rather than on every parse
+        template = cls.__fields__['template'].default
+        cls.__template_regex__, cls.__template_keys__, cls.__template_date_formats__ = (
+            _typed_template_regex(cls,template) if template else (None,[],{})
+        )
+
+    @classmethod
+    def _string_values(cls,string:str)->dict:
+        match = cls.__template_regex__.fullmatch(string)
+        if match is None:
+            raise AttributeError(f"'{string}' doesn't match the template '{cls.__fields__['template'].default}'")
+        values = dict(zip(cls.__template_keys__,match.groups()))
+        for key,date_format in cls.__template_date_formats__.items():
+            values[key] = dt.datetime.strptime(values[key],date_format)
+        return values
     
     @classmethod
     def parse_string(cls,string):
-        string_format = cls.__fields__['template'].default
-        values = string_to_dict(string,string_format)
-        return cls(**values)
+        return cls(**cls._string_values(string))
+
+    @classmethod
+    def _fields_model(cls)->Type[BaseModel]:
+        "A model of just the template's fields, cached on the class"
+        model = cls.__dict__.get('__fields_model__')
+        if model is None:
+            model = create_model(
+                f'{cls.__name__}Fields',
+                **{key:(cls.__fields__[key].outer_type_,...) for key in cls.__template_keys__}
+            )
+            cls.__fields_model__ = model
+        return model
+
+    @classmethod
+    def parse_many(
+        cls,
+        strings:Iterable[str],
+        validate:bool=True, # cast the values to the types of the fields. Otherwise values are left as strings
+        **kwargs # passed to `parse_dataframe_columns_as` if validating, e.g. `errors='drop'`
+    )->pd.DataFrame:
+        """A DataFrame of the fields of many strings, extracted all at once with the template's regex. 
+        
+        Strings that don't match the template are null before validation. Custom validators of the template's fields aren't run."""
+        strings = strings if isinstance(strings,pd.Series) else pd.Series(list(strings),dtype=object)
+        df = strings.str.extract(cls.__template_regex__)
+        df.columns = cls.__template_keys__
+        if not validate:
+            return df
+        for key,date_format in cls.__template_date_formats__.items():
+            df[key] = pd.to_datetime(df[key],format=date_format,errors='coerce')
+        return parse_dataframe_columns_as(cls._fields_model(),df,**kwargs)
     
     @validator('template',always=True)
     def validate_template(cls,v):
@@ -66,7 +195,85 @@ class StringTemplate(BaseModel):
         **kwargs
     ):
         if string: 
-            obj = self.parse_string(string)
-            super().__init__(**obj.dict())
+            super().__init__(**self._string_values(string))
         else:
             super().__init__(**kwargs)
+
+# %% ../nbs/06_string_templating.ipynb 21
+class TemplateIndex:
+    """An index of the paths that match a `StringTemplate`, for finding paths by the values of their fields. 
+    
+    Fields are kept as categorical columns, so queries compare small integer codes rather than parsing or comparing values."""
+    def __init__(
+        self,
+        template:Type[StringTemplate],
+        paths:Iterable[str]=() # paths that don't match the template are left out
+    ):
+        self.template = template
+        self.keys = list(template.__template_keys__)
+        self.frame = self._parse(paths)
+
+    @classmethod
+    def from_directory(cls,template:Type[StringTemplate],root:Union[str,os.PathLike]):
+        "An index of the files under `root`, with paths relative to `root`"
+        return cls(template,(
+            os.path.relpath(os.path.join(folder,name),root).replace(os.sep,'/')
+            for folder,_,names in os.walk(root) for name in names
+        ))
+
+    def _parse(self,paths:Iterable[str])->pd.DataFrame:
+        paths = pd.Series(list(paths),dtype=object)
+        fields = self.template.parse_many(paths,errors='drop')
+        frame = pd.concat([paths[fields.index].rename('path'),fields[self.keys]],axis=1).reset_index(drop=True)
+        for key in self.keys:
+            # categories are sorted, which range queries rely on
+            frame[key] = pd.Categorical(frame[key])
+        return frame
+
+    def add(self,paths:Iterable[str]):
+        "Adds `paths` to the index, replacing any that are already in it"
+        new = self._parse(paths)
+        if len(new)==0:
+            return
+        if len(self.frame)==0:
+            self.frame = new
+            return
+        combined = pd.DataFrame({
+            'path':pd.concat([self.frame.path,new.path],ignore_index=True),
+            **{key:union_categoricals([self.frame[key],new[key]],sort_categories=True) for key in self.keys}
+        })
+        self.frame = combined[~combined.path.duplicated(keep='last')].reset_index(drop=True)
+
+    def remove(self,paths:Iterable[str]):
+        self.frame = self.frame[~self.frame.path.isin(list(paths))].reset_index(drop=True)
+
+    def _mask(self,key:str,condition)->np.ndarray:
+        if key not in self.keys:
+            raise ValueError(f"'{key}' isn't a field of {self.template.__name__}")
+        categories = self.frame[key].cat.categories
+        codes = self.frame[key].cat.codes.to_numpy()
+        # cast conditions to the field's type, e.g. '2024' to 2024
+        field_type = self.template.__fields__[key].outer_type_
+        if isinstance(condition,slice):
+            start = 0 if condition.start is None else categories.searchsorted(parse_obj_as(field_type,condition.start),'left')
+            stop = len(categories) if condition.stop is None else categories.searchsorted(parse_obj_as(field_type,condition.stop),'right')
+            return (codes>=start)&(codes<stop)
+        values = condition if isinstance(condition,(list,tuple,set,frozenset)) else [condition]
+        wanted = categories.get_indexer([parse_obj_as(field_type,value) for value in values])
+        return np.isin(codes,wanted[wanted>=0])
+
+    def query(self,**conditions)->pd.DataFrame:
+        """The paths, and their fields, matching every condition. 
+        
+        A condition is a value, a list of values, or a `slice(start,stop)` of values where (like `.loc`) both ends are included. 
+        Fields without conditions match anything."""
+        mask = np.ones(len(self.frame),dtype=bool)
+        for key,condition in conditions.items():
+            mask &= self._mask(key,condition)
+        return self.frame[mask]
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __repr__(self):
+        return f"<TemplateIndex of {len(self)} {self.template.__name__} paths>"
@@ -29,6 +29,9 @@ if cfg.get('pip_requirements'): requirements += cfg.get('pip_requirements','').s
 min_python = cfg['min_python']
 lic = licenses.get(cfg['license'].lower(), (cfg['license'], None))
 dev_requirements = (cfg.get('dev_requirements') or '').split()
+# optional dependencies from the `*_requirements` settings, e.g. `pip install archetypon[snowflake]`
+extras = {o[:-len('_requirements')]:cfg[o].split() for o in cfg if o.endswith('_requirements') and o not in ('dev_requirements','pip_requirements')}
+extras['all'] = sorted({r for o in extras.values() for r in o})
 
 setuptools.setup(
     name = cfg['lib_name'],
@@ -42,7 +45,7 @@ setuptools.setup(
     packages = setuptools.find_packages(),
     include_package_data = True,
     install_requires = requirements,
-    extras_require={ 'dev': dev_requirements },
+    extras_require={ 'dev': dev_requirements, **extras },
     dependency_links = cfg.get('dep_links','').split(),
     python_requires  = '>=' + cfg['min_python'],
     long_description = open('README.md').read(),